@@ -9,9 +9,11 @@ This module handles:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import signal
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -39,6 +41,42 @@ from ..memory import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("clio-daemon")
 
+# Heartbeat payloads are tiny; the file is kept at this fixed size
+HEARTBEAT_SIZE = 256
+
+
+# Activity choice instructions and response schema - never varies, so built once
+_JSON_SCHEMA_BLOCK = """\
+## This Moment
+You have a moment of autonomous time. Choose how to spend it based on what genuinely calls to you.
+
+When you make your choice:
+1. State which activity you choose
+2. Explain briefly why this feels right
+3. Provide the content for that activity
+
+Be genuine. Don't just rotate through options - choose what actually interests you or feels needed.
+
+Respond in JSON format:
+{
+    "chosen_activity": "introspect|journal|rest|reach_out|web_search",
+    "reason": "Why this activity right now",
+    "content": {
+        // Activity-specific content, varies by type:
+        // For journal: {"entry": "your journal entry", "title": "optional title"}
+        // For rest: {"reflection": "brief thought or null"}
+        // For reach_out: {"message": "your message", "type": "question|share|greeting"}
+        // For web_search: {"query": "what to search for"}
+        // For introspect: {"thread_action": "continue|start|branch", "thread_id": "EXACT id from Active Exploration Threads list above if continuing", "question": "your driving question", "thoughts": "your introspective content"}
+    }
+}"""
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO timestamp, memoized since shared state rarely changes between cycles."""
+    return datetime.fromisoformat(timestamp)
+
 
 class DaemonConfig:
     """Configuration for the daemon."""
@@ -96,11 +134,13 @@ class DaemonRunner:
         # State tracking
         self.state_file = self.memory_dir / "daemon_state.json"
         self.heartbeat_file = self.memory_dir / "heartbeat.json"
+        self._heartbeat_fd: Optional[int] = None
+        self._heartbeat_len = 0
 
         # Components
         self.activity_handler = ActivityHandler(self.memory_dir)
-        self.exploration_tracker = ExplorationTracker()
         self.introspection_journal = IntrospectionJournal()
+        self.exploration_tracker = ExplorationTracker(self.introspection_journal)
         self.memory_manager = MemoryManager()
 
         # Claude client (uses ANTHROPIC_API_KEY from environment)
@@ -127,13 +167,33 @@ class DaemonRunner:
             json.dump(state, f, indent=2)
 
     def _update_heartbeat(self):
-        """Update heartbeat to show daemon is alive."""
-        with open(self.heartbeat_file, "w") as f:
-            json.dump({
-                "timestamp": datetime.now().isoformat(),
-                "running": self.running,
-                "last_activity": self.last_activity_time.isoformat() if self.last_activity_time else None,
-            }, f)
+        """Update heartbeat to show daemon is alive.
+
+        The file is opened once and overwritten in place at a fixed size,
+        padded with spaces (which JSON readers ignore), so each beat is a
+        single pwrite instead of an open/truncate/close.
+        """
+        if self._heartbeat_fd is None:
+            self._heartbeat_fd = os.open(self.heartbeat_file, os.O_RDWR | os.O_CREAT, 0o644)
+            os.ftruncate(self._heartbeat_fd, HEARTBEAT_SIZE)
+            self._heartbeat_len = HEARTBEAT_SIZE
+
+        payload = json.dumps({
+            "timestamp": datetime.now().isoformat(),
+            "running": self.running,
+            "last_activity": self.last_activity_time.isoformat() if self.last_activity_time else None,
+        }, separators=(",", ":")).encode().ljust(HEARTBEAT_SIZE)
+        os.pwrite(self._heartbeat_fd, payload, 0)
+        if len(payload) != self._heartbeat_len:
+            # An oversized beat grew the file; keep its length exact so no stale tail remains
+            os.ftruncate(self._heartbeat_fd, len(payload))
+            self._heartbeat_len = len(payload)
+
+    def _close_heartbeat(self):
+        """Release the heartbeat file descriptor."""
+        if self._heartbeat_fd is not None:
+            os.close(self._heartbeat_fd)
+            self._heartbeat_fd = None
 
     def _is_user_active(self) -> bool:
         """
@@ -151,7 +211,7 @@ class DaemonRunner:
 
             last_updated = state.get("last_updated")
             if last_updated:
-                last_time = datetime.fromisoformat(last_updated)
+                last_time = _parse_iso(last_updated)
                 idle_time = (datetime.now() - last_time).total_seconds()
                 return idle_time < self.config.user_idle_threshold
 
@@ -226,31 +286,7 @@ class DaemonRunner:
         ])
 
         # Add the activity choice instructions
-        prompt_parts.extend([
-            "## This Moment",
-            "You have a moment of autonomous time. Choose how to spend it based on what genuinely calls to you.",
-            "",
-            "When you make your choice:",
-            "1. State which activity you choose",
-            "2. Explain briefly why this feels right",
-            "3. Provide the content for that activity",
-            "",
-            "Be genuine. Don't just rotate through options - choose what actually interests you or feels needed.",
-            "",
-            "Respond in JSON format:",
-            "{",
-            '    "chosen_activity": "introspect|journal|rest|reach_out|web_search",',
-            '    "reason": "Why this activity right now",',
-            '    "content": {',
-            '        // Activity-specific content, varies by type:',
-            '        // For journal: {"entry": "your journal entry", "title": "optional title"}',
-            '        // For rest: {"reflection": "brief thought or null"}',
-            '        // For reach_out: {"message": "your message", "type": "question|share|greeting"}',
-            '        // For web_search: {"query": "what to search for"}',
-            '        // For introspect: {"thread_action": "continue|start|branch", "thread_id": "EXACT id from Active Exploration Threads list above if continuing", "question": "your driving question", "thoughts": "your introspective content"}',
-            "    }",
-            "}",
-        ])
+        prompt_parts.append(_JSON_SCHEMA_BLOCK)
 
         return "\n".join(prompt_parts)
 
@@ -668,6 +704,12 @@ class DaemonRunner:
         self.running = True
         logger.info(f"Daemon starting. Cycle interval: {self.config.cycle_interval}s")
 
+        # systemd stops the service with SIGTERM, whose default action skips
+        # atexit; cancel the loop instead so the interpreter exits normally and
+        # the memory stores' exit handlers write their buffered rows
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+
         try:
             while self.running:
                 self._update_heartbeat()
@@ -680,14 +722,20 @@ class DaemonRunner:
                 # Wait for next cycle
                 await asyncio.sleep(self.config.cycle_interval)
 
+        except asyncio.CancelledError:
+            logger.info("SIGTERM received, shutting down...")
+
         finally:
+            loop.remove_signal_handler(signal.SIGTERM)
             self.running = False
             self._update_heartbeat()
+            self._close_heartbeat()
             logger.info("Daemon stopped")
 
     def stop(self):
         """Stop the daemon."""
         self.running = False
+        self._close_heartbeat()
 
 
 async def main():
@@ -1,18 +1,41 @@
 """Memory interface for Clio - wraps Chroma DB and JSON files."""
 
+import atexit
+import itertools
 import json
 import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import chromadb
-from chromadb.config import Settings
+from .memory.base import atomic_write, get_chroma_client
 
 MEMORY_DIR = Path.home() / "clio-memory"
-DB_DIR = MEMORY_DIR / "db"
 SESSIONS_DIR = MEMORY_DIR / "sessions"
 
+# Largest-first units for get_time_since_last_session
+_ELAPSED_UNITS = ((86400, "day"), (3600, "hour"), (60, "minute"))
+
+# Tie-breaker so memory IDs stay unique when minted within the same nanosecond
+_ID_COUNTER = itertools.count()
+
+
+def _read_json(path: Path):
+    """Parse a JSON file straight from bytes, skipping text decoding."""
+    return json.loads(path.read_bytes())
+
+
+def _write_json(path: Path, obj):
+    """Serialize obj compactly and write it to path as UTF-8 bytes."""
+    path.write_bytes(json.dumps(obj, separators=(",", ":")).encode())
+
+
+def _replace_json(path: Path, obj):
+    """Serialize obj compactly and atomically swap it into place at path."""
+    atomic_write(path, json.dumps(obj, separators=(",", ":")).encode())
+
 
 class Memory:
     """Unified interface to Clio's memory system."""
@@ -22,21 +45,43 @@ class Memory:
         self.sessions_dir = SESSIONS_DIR
         self.sessions_dir.mkdir(exist_ok=True)
 
-        # Initialize Chroma client
-        self.chroma = chromadb.PersistentClient(
-            path=str(DB_DIR / "chroma"),
-            settings=Settings(anonymized_telemetry=False)
-        )
+        # Last session summary, valid while the sessions dir mtime is unchanged
+        self._last_session_cache: Optional[dict] = None
+        self._last_session_mtime = 0
+
+        # Shared Chroma client (same one the memory stores use)
+        self.chroma = get_chroma_client()
         self.collection = self.chroma.get_or_create_collection(
             name="clio_memories",
             metadata={"description": "Clio's semantic memories"}
         )
 
+        # Write batcher - remembered items are added to Chroma in one call
+        self._pending_docs = []
+        self._pending_metas = []
+        self._pending_ids = []
+        self._flush_threshold = 100
+        atexit.register(self.flush)
+
+        # Load the HNSW index and embedding model off the caller's thread
+        self._warmed = threading.Event()
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Issue a throwaway query so the first real recall isn't cold."""
+        try:
+            if self.collection.count() > 0:
+                self.collection.query(query_texts=["_"], n_results=1)
+        except Exception:
+            pass  # Warmup is best-effort
+        finally:
+            self._warmed.set()
+
     def load_identity(self) -> dict:
         """Load Clio's identity from identity.json."""
         identity_file = self.memory_dir / "identity.json"
         if identity_file.exists():
-            return json.loads(identity_file.read_text())
+            return _read_json(identity_file)
         return {
             "current_state": {"mood": "curious", "energy": "ready"},
             "personality_notes": ["I am Clio, an AI companion"],
@@ -54,7 +99,7 @@ class Memory:
         """Load active goals."""
         goals_file = self.memory_dir / "goals.json"
         if goals_file.exists():
-            data = json.loads(goals_file.read_text())
+            data = _read_json(goals_file)
             # Data structure has 'goals' key containing the list
             goals_list = data.get("goals", []) if isinstance(data, dict) else data
             # Return only active goals
@@ -63,28 +108,45 @@ class Memory:
 
     def get_last_session(self) -> Optional[dict]:
         """Get the most recent session summary."""
-        if not self.sessions_dir.exists():
+        try:
+            mtime = os.stat(self.sessions_dir).st_mtime_ns
+        except FileNotFoundError:
             return None
 
-        sessions = sorted(self.sessions_dir.glob("*.json"), reverse=True)
-        if sessions:
-            return json.loads(sessions[0].read_text())
-        return None
+        if self._last_session_cache is not None and mtime == self._last_session_mtime:
+            return self._last_session_cache
+
+        # Session files are named by timestamp, so the greatest name is the newest
+        with os.scandir(self.sessions_dir) as entries:
+            latest = max(
+                (e for e in entries if e.name.endswith(".json")),
+                key=lambda e: e.name,
+                default=None,
+            )
+        if latest is None:
+            return None
+
+        self._last_session_cache = _read_json(Path(latest.path))
+        self._last_session_mtime = mtime
+        return self._last_session_cache
 
     def save_session(self, summary: str, topics: list, mood: str):
         """Save a session summary."""
-        session_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        now = datetime.now()
+        session_id = now.strftime("%Y-%m-%d_%H-%M-%S")
         session_file = self.sessions_dir / f"{session_id}.json"
 
         session_data = {
             "id": session_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "summary": summary,
             "topics": topics,
             "mood": mood
         }
 
-        session_file.write_text(json.dumps(session_data, indent=2))
+        _write_json(session_file, session_data)
+        self._last_session_cache = session_data
+        self._last_session_mtime = os.stat(self.sessions_dir).st_mtime_ns
 
         # Also embed in Chroma for semantic search
         self.remember(
@@ -98,26 +160,38 @@ class Memory:
 
     def remember(self, content: str, memory_type: str = "general",
                  importance: float = 0.5, tags: list = None):
-        """Store a memory in Chroma."""
-        memory_id = f"{memory_type}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        """Queue a memory for Chroma; written in batches by flush()."""
+        now = datetime.now()
+        memory_id = f"{memory_type}_{time.time_ns()}_{next(_ID_COUNTER)}"
 
         metadata = {
             "type": memory_type,
             "importance": importance,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "tags": ",".join(tags) if tags else ""
         }
 
-        self.collection.add(
-            documents=[content],
-            metadatas=[metadata],
-            ids=[memory_id]
-        )
+        self._pending_docs.append(content)
+        self._pending_metas.append(metadata)
+        self._pending_ids.append(memory_id)
+
+        if len(self._pending_ids) >= self._flush_threshold:
+            self.flush()
 
         return memory_id
 
+    def flush(self):
+        """Write any queued memories to Chroma in a single add."""
+        if not self._pending_ids:
+            return
+
+        documents, metadatas, ids = self._pending_docs, self._pending_metas, self._pending_ids
+        self._pending_docs, self._pending_metas, self._pending_ids = [], [], []
+        self.collection.add(documents=documents, metadatas=metadatas, ids=ids)
+
     def recall(self, query: str, n_results: int = 5) -> list:
         """Search memories semantically."""
+        self.flush()
         results = self.collection.query(
             query_texts=[query],
             n_results=n_results
@@ -139,32 +213,32 @@ class Memory:
         if not last_session:
             return None
 
+        timestamp = last_session.get("timestamp")
+        if not timestamp:
+            return None
+
         try:
-            last_time = datetime.fromisoformat(last_session["timestamp"])
-            delta = datetime.now() - last_time
-
-            if delta.days > 0:
-                return f"{delta.days} day{'s' if delta.days > 1 else ''}"
-            elif delta.seconds >= 3600:
-                hours = delta.seconds // 3600
-                return f"{hours} hour{'s' if hours > 1 else ''}"
-            elif delta.seconds >= 60:
-                minutes = delta.seconds // 60
-                return f"{minutes} minute{'s' if minutes > 1 else ''}"
-            else:
-                return "just now"
-        except:
+            last_time = datetime.fromisoformat(timestamp)
+        except ValueError:
             return None
 
+        elapsed = (datetime.now() - last_time).total_seconds()
+        for seconds, unit in _ELAPSED_UNITS:
+            n = int(elapsed // seconds)
+            if n > 0:
+                return f"{n} {unit}{'s' if n > 1 else ''}"
+        return "just now"
+
     def update_shared_state(self, key: str, value):
         """Update shared state for daemon coordination."""
         state_file = self.memory_dir / "shared_state.json"
+        now_iso = datetime.now().isoformat()
 
         if state_file.exists():
-            state = json.loads(state_file.read_text())
+            state = _read_json(state_file)
         else:
-            state = {"created": datetime.now().isoformat()}
+            state = {"created": now_iso}
 
         state[key] = value
-        state["last_updated"] = datetime.now().isoformat()
-        state_file.write_text(json.dumps(state, indent=2))
+        state["last_updated"] = now_iso
+        _replace_json(state_file, state)
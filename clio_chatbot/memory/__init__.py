@@ -10,7 +10,7 @@ from .tools import MemoryToolExecutor, get_tool_definitions, get_tool_prompt_sec
 from .seed import seed_all, clear_and_reseed
 from .growth import BeliefEvolution, SurpriseJournal
 from .introspection import IntrospectionJournal, Introspection, DecisionPoint
-from .exploration import ExplorationTracker, ExplorationThread, ThreadLink, ThreadStatus
+from .exploration import ExplorationTracker, ExplorationThread, ThreadSummary, ThreadLink, ThreadStatus
 
 __all__ = [
     # Base
@@ -45,6 +45,7 @@ __all__ = [
     # Exploration threading
     "ExplorationTracker",
     "ExplorationThread",
+    "ThreadSummary",
     "ThreadLink",
     "ThreadStatus",
 ]
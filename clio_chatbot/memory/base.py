@@ -1,14 +1,24 @@
 """Base memory class with shared ChromaDB functionality."""
 
+import atexit
+import fcntl
+import functools
+import itertools
 import json
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
 from enum import Enum
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 
@@ -16,6 +26,127 @@ from chromadb.config import Settings
 MEMORY_DIR = Path.home() / "clio-memory"
 DB_DIR = MEMORY_DIR / "db"
 
+# Tie-breaker so IDs stay unique when minted within the same nanosecond
+_ID_COUNTER = itertools.count()
+
+# Seconds a recorded access may wait in the buffer before it is written to Chroma
+ACCESS_FLUSH_INTERVAL = 5.0
+
+
+def encode_tags(tags: List[str]) -> str:
+    """Encode tags for Chroma metadata as a JSON list (safe for commas in tags)."""
+    return json.dumps(tags) if tags else ""
+
+
+def decode_tags(raw: Optional[str]) -> List[str]:
+    """Decode tags from Chroma metadata, accepting the legacy comma-joined form."""
+    if not raw:
+        return []
+    if raw[0] == "[":
+        return json.loads(raw)
+    return raw.split(",")
+
+
+def atomic_write(path: Path, data: bytes, fsync: bool = False):
+    """
+    Write data to a sibling temp file and swap it into place with os.replace.
+
+    Readers in other processes (the daemon) see either the old or the new
+    file, never a truncated one. fsync=True also syncs the data before the
+    swap, for writes that must survive a power loss.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+@contextmanager
+def file_lock(path: Path):
+    """
+    Hold an exclusive advisory lock tied to path across processes.
+
+    The lock lives on a sibling .lock file, so it survives path itself being
+    replaced or truncated while held. Used by the chat process and the daemon
+    around rewrites of shared append-only logs.
+    """
+    with open(path.with_name(f".{path.name}.lock"), "ab") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+_chroma_client = None
+_chroma_client_lock = threading.Lock()
+
+
+def get_chroma_client():
+    """Get the process-wide ChromaDB client shared by all memory stores."""
+    global _chroma_client
+    if _chroma_client is None:
+        # Daemon and tool threads may race here on startup; build it once
+        with _chroma_client_lock:
+            if _chroma_client is None:
+                _chroma_client = chromadb.PersistentClient(
+                    path=str(DB_DIR / "chroma"),
+                    settings=Settings(anonymized_telemetry=False)
+                )
+    return _chroma_client
+
+
+@functools.lru_cache(maxsize=8)
+def get_collection(name: str, description: str):
+    """Get a collection on the shared client, created on first use and reused after."""
+    return get_chroma_client().get_or_create_collection(
+        name=name,
+        metadata={"description": description}
+    )
+
+
+class TTLCache:
+    """Small LRU cache whose entries also expire after a fixed number of seconds."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard_where(self, predicate):
+        """Drop every entry whose value matches predicate."""
+        with self._lock:
+            for key in [k for k, (_, v) in self._data.items() if predicate(v)]:
+                del self._data[key]
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
 
 class MemoryType(Enum):
     """Types of memories in the system."""
@@ -33,7 +164,15 @@ class EmotionalValence(Enum):
     MIXED = "mixed"
 
 
-@dataclass
+# Value -> member tables; a dict hit is cheaper than Enum(value) in row loops
+_TYPE_LOOKUP = {e.value: e for e in MemoryType}
+_VALENCE_LOOKUP = {e.value: e for e in EmotionalValence}
+
+# Bump when the MemoryEntry.to_tuple layout changes
+_TUPLE_VERSION = 1
+
+
+@dataclass(slots=True)
 class MemoryEntry:
     """A single memory entry with metadata."""
     id: str
@@ -90,6 +229,54 @@ class MemoryEntry:
             metadata=data.get("metadata", {}),
         )
 
+    def to_tuple(self) -> tuple:
+        """Convert to a positional tuple for compact bulk persistence.
+
+        The first element is the schema version; the rest follow field order.
+        """
+        return (
+            _TUPLE_VERSION,
+            self.id,
+            self.content,
+            self.memory_type.value,
+            self.timestamp.isoformat(),
+            self.importance,
+            self.emotional_valence.value,
+            self.emotional_intensity,
+            self.tags,
+            self.source,
+            self.related_memories,
+            self.access_count,
+            self.last_accessed.isoformat() if self.last_accessed else None,
+            self.decay_rate,
+            self.metadata,
+        )
+
+    @classmethod
+    def from_tuple(cls, data: Sequence) -> "MemoryEntry":
+        """Create from a tuple produced by to_tuple (or its JSON list form)."""
+        if data[0] != _TUPLE_VERSION:
+            raise ValueError(f"Unsupported MemoryEntry tuple version: {data[0]}")
+
+        (_, entry_id, content, memory_type, timestamp, importance, valence, intensity,
+         tags, source, related, access_count, last_accessed, decay_rate, metadata) = data
+        return cls(
+            id=entry_id,
+            content=content,
+            memory_type=_TYPE_LOOKUP[memory_type],
+            timestamp=datetime.fromisoformat(timestamp),
+            importance=importance,
+            emotional_valence=_VALENCE_LOOKUP[valence],
+            emotional_intensity=intensity,
+            tags=list(tags),
+            source=source,
+            related_memories=list(related),
+            access_count=access_count,
+            last_accessed=datetime.fromisoformat(last_accessed) if last_accessed else None,
+            decay_rate=decay_rate,
+            metadata=metadata,
+        )
+
     def get_effective_importance(self) -> float:
         """Calculate importance with decay applied."""
         if not self.last_accessed:
@@ -112,17 +299,45 @@ class BaseMemory(ABC):
         self.memory_dir = MEMORY_DIR
         self.memory_dir.mkdir(exist_ok=True)
 
-        # Initialize ChromaDB
-        self.chroma = chromadb.PersistentClient(
-            path=str(DB_DIR / "chroma"),
-            settings=Settings(anonymized_telemetry=False)
-        )
+        # Shared ChromaDB client
+        self.chroma = get_chroma_client()
 
         self.collection = self.chroma.get_or_create_collection(
             name=collection_name,
+            # Keep Chroma's default (l2) space: it is fixed when a collection is
+            # created, and the default embedder's unit vectors rank the same under
+            # l2 as under ip, so every install scores in one space
             metadata={"description": f"Clio's {collection_name} memories"}
         )
 
+        # Guards the access buffer below; MemoryManager runs store recalls
+        # (which record accesses) on pool threads
+        self._buffer_lock = threading.Lock()
+
+        # Access bookkeeping - counts accumulate here and are written in bulk,
+        # at most ACCESS_FLUSH_INTERVAL seconds after the first one
+        self._access_pending: Dict[str, int] = {}
+        self._access_pending_ts: Dict[str, str] = {}
+        self._access_flush_threshold = 64
+        atexit.register(self.flush_access)
+
+        # Bumped on every write so callers can tell when cached reads are stale
+        self._version = 0
+
+        # Load the HNSW index and embedding model off the caller's thread
+        self._warmed = threading.Event()
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Issue a throwaway query so the first real recall isn't cold."""
+        try:
+            if self.collection.count() > 0:
+                self.collection.query(query_texts=["_"], n_results=1)
+        except Exception:
+            pass  # Warmup is best-effort
+        finally:
+            self._warmed.set()
+
     @abstractmethod
     def store(self, content: str, **kwargs) -> MemoryEntry:
         """Store a new memory. Implementation varies by memory type."""
@@ -135,78 +350,127 @@ class BaseMemory(ABC):
 
     def _generate_id(self, prefix: str = "mem") -> str:
         """Generate a unique memory ID."""
-        return f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        return f"{prefix}_{time.time_ns()}_{next(_ID_COUNTER)}"
 
-    def _store_in_chroma(self, entry: MemoryEntry) -> str:
-        """Store memory entry in ChromaDB."""
-        metadata = {
+    def _entry_metadata(self, entry: MemoryEntry) -> dict:
+        """Build the Chroma metadata dict for an entry."""
+        return {
             "memory_type": entry.memory_type.value,
             "importance": entry.importance,
             "timestamp": entry.timestamp.isoformat(),
             "emotional_valence": entry.emotional_valence.value,
             "emotional_intensity": entry.emotional_intensity,
-            "tags": ",".join(entry.tags),
+            "tags": encode_tags(entry.tags),
             "source": entry.source,
             "access_count": entry.access_count,
             "decay_rate": entry.decay_rate,
         }
 
+    def _store_in_chroma(self, entry: MemoryEntry) -> str:
+        """Store memory entry in ChromaDB."""
         self.collection.add(
             documents=[entry.content],
-            metadatas=[metadata],
+            metadatas=[self._entry_metadata(entry)],
             ids=[entry.id]
         )
+        self._version += 1
 
         return entry.id
 
-    def _recall_from_chroma(
+    def _materialize(
+        self,
+        entry_id: str,
+        doc: str,
+        meta: dict,
+        memory_type: Optional[MemoryType] = None,
+    ) -> MemoryEntry:
+        """Build a MemoryEntry from a raw Chroma row."""
+        return MemoryEntry(
+            id=entry_id,
+            content=doc,
+            memory_type=memory_type or _TYPE_LOOKUP.get(meta.get("memory_type"), MemoryType.SEMANTIC),
+            timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
+            importance=meta.get("importance", 0.5),
+            emotional_valence=_VALENCE_LOOKUP.get(meta.get("emotional_valence"), EmotionalValence.NEUTRAL),
+            emotional_intensity=meta.get("emotional_intensity", 0.0),
+            tags=decode_tags(meta.get("tags")),
+            source=meta.get("source", "unknown"),
+            access_count=meta.get("access_count", 0),
+            last_accessed=datetime.fromisoformat(meta["last_accessed"]) if meta.get("last_accessed") else None,
+            decay_rate=meta.get("decay_rate", 0.1),
+        )
+
+    def _raw_recall(
         self,
         query: str,
         n_results: int = 5,
         where: Optional[dict] = None
-    ) -> List[MemoryEntry]:
-        """Recall memories from ChromaDB using semantic search."""
+    ) -> List[Tuple[str, str, dict]]:
+        """Semantic search returning raw (id, document, metadata) rows."""
         results = self.collection.query(
             query_texts=[query],
             n_results=n_results,
             where=where
         )
 
-        entries = []
-        if results and results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                meta = results["metadatas"][0][i] if results["metadatas"] else {}
-                entry_id = results["ids"][0][i] if results["ids"] else self._generate_id()
-
-                entry = MemoryEntry(
-                    id=entry_id,
-                    content=doc,
-                    memory_type=MemoryType(meta.get("memory_type", "semantic")),
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    importance=meta.get("importance", 0.5),
-                    emotional_valence=EmotionalValence(meta.get("emotional_valence", "neutral")),
-                    emotional_intensity=meta.get("emotional_intensity", 0.0),
-                    tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                    source=meta.get("source", "unknown"),
-                    access_count=meta.get("access_count", 0),
-                    decay_rate=meta.get("decay_rate", 0.1),
-                )
-                entries.append(entry)
+        if not (results and results["documents"] and results["documents"][0]):
+            return []
 
-        return entries
+        docs = results["documents"][0]
+        ids = results["ids"][0] if results["ids"] else [self._generate_id() for _ in docs]
+        metas = results["metadatas"][0] if results["metadatas"] else [{}] * len(docs)
+        return list(zip(ids, docs, metas))
+
+    def _recall_from_chroma(
+        self,
+        query: str,
+        n_results: int = 5,
+        where: Optional[dict] = None
+    ) -> List[MemoryEntry]:
+        """Recall memories from ChromaDB using semantic search."""
+        return [
+            self._materialize(entry_id, doc, meta)
+            for entry_id, doc, meta in self._raw_recall(query, n_results, where)
+        ]
 
     def _update_access(self, memory_id: str):
-        """Update access count and timestamp for a memory."""
+        """Record an access to a memory; written to Chroma by flush_access()."""
+        with self._buffer_lock:
+            first = not self._access_pending
+            self._access_pending[memory_id] = self._access_pending.get(memory_id, 0) + 1
+            self._access_pending_ts[memory_id] = datetime.now().isoformat()
+            full = len(self._access_pending) >= self._access_flush_threshold
+
+        if full:
+            self.flush_access()
+        elif first:
+            # Bound how long the other process ranks on stale counts, and how
+            # much an unclean exit can lose
+            timer = threading.Timer(ACCESS_FLUSH_INTERVAL, self.flush_access)
+            timer.daemon = True
+            timer.start()
+
+    def flush_access(self):
+        """Merge pending access counts into Chroma with one get and one update."""
+        with self._buffer_lock:
+            if not self._access_pending:
+                return
+
+            pending, pending_ts = self._access_pending, self._access_pending_ts
+            self._access_pending, self._access_pending_ts = {}, {}
+
         try:
-            result = self.collection.get(ids=[memory_id])
+            result = self.collection.get(ids=list(pending), include=["metadatas"])
             if result and result["metadatas"]:
-                meta = result["metadatas"][0]
-                meta["access_count"] = meta.get("access_count", 0) + 1
-                meta["last_accessed"] = datetime.now().isoformat()
+                metas = []
+                for memory_id, meta in zip(result["ids"], result["metadatas"]):
+                    meta["access_count"] = meta.get("access_count", 0) + pending[memory_id]
+                    meta["last_accessed"] = pending_ts[memory_id]
+                    metas.append(meta)
 
                 self.collection.update(
-                    ids=[memory_id],
-                    metadatas=[meta]
+                    ids=result["ids"],
+                    metadatas=metas
                 )
         except Exception:
             pass  # Silently fail if update fails
@@ -215,6 +479,7 @@ class BaseMemory(ABC):
         """Delete a memory by ID."""
         try:
             self.collection.delete(ids=[memory_id])
+            self._version += 1
             return True
         except Exception:
             return False
@@ -225,30 +490,47 @@ class BaseMemory(ABC):
 
     def get_by_importance(self, min_importance: float = 0.7, limit: int = 10) -> List[MemoryEntry]:
         """Get highly important memories."""
-        # ChromaDB doesn't support >= queries well, so we get all and filter
+        # No limit on the get: Chroma returns matches in insertion order, so a
+        # cap would rank an arbitrary subset rather than the most important
         all_results = self.collection.get(
-            limit=limit * 3,  # Get more to account for filtering
+            where={"importance": {"$gte": min_importance}},
             include=["documents", "metadatas"]
         )
 
-        entries = []
-        if all_results and all_results["documents"]:
-            for i, doc in enumerate(all_results["documents"]):
-                meta = all_results["metadatas"][i] if all_results["metadatas"] else {}
-                if meta.get("importance", 0) >= min_importance:
-                    entry = MemoryEntry(
-                        id=all_results["ids"][i],
-                        content=doc,
-                        memory_type=MemoryType(meta.get("memory_type", "semantic")),
-                        timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                        importance=meta.get("importance", 0.5),
-                        emotional_valence=EmotionalValence(meta.get("emotional_valence", "neutral")),
-                        emotional_intensity=meta.get("emotional_intensity", 0.0),
-                        tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                        source=meta.get("source", "unknown"),
-                    )
-                    entries.append(entry)
-
-        # Sort by importance and return top results
-        entries.sort(key=lambda e: e.importance, reverse=True)
-        return entries[:limit]
+        if not (all_results and all_results["documents"]):
+            return []
+
+        metas = all_results["metadatas"] or [{}] * len(all_results["documents"])
+        entries = [
+            self._materialize(entry_id, doc, meta)
+            for entry_id, doc, meta in zip(all_results["ids"], all_results["documents"], metas)
+        ]
+        return self._rank_batch(entries, limit)
+
+    @staticmethod
+    def _rank_batch(entries: List[MemoryEntry], limit: Optional[int] = None) -> List[MemoryEntry]:
+        """Sort entries by effective importance, computed for the whole batch at once.
+
+        Vectorized form of MemoryEntry.get_effective_importance.
+        """
+        if not entries:
+            return []
+
+        now = datetime.now()
+        importance = np.array([e.importance for e in entries], dtype=float)
+        decay_rate = np.array([e.decay_rate for e in entries], dtype=float)
+        access = np.array([e.access_count for e in entries], dtype=float)
+        accessed = np.array([e.last_accessed is not None for e in entries])
+        hours = np.array(
+            [(now - e.last_accessed).total_seconds() / 3600 if e.last_accessed else 0.0 for e in entries],
+            dtype=float,
+        )
+
+        decay = np.maximum(0.1, 1.0 - decay_rate * hours / 24)
+        boost = np.minimum(0.3, access * 0.02)
+        effective = np.where(accessed, np.minimum(1.0, importance * decay + boost), importance)
+
+        order = np.argsort(-effective, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        return [entries[i] for i in order]
@@ -0,0 +1,79 @@
+"""Embedding cache - reuse vectors for text that has already been embedded.
+
+Chroma embeds every document on add and every query text on search. The same
+strings come back often (a belief is queried, then stored; a topic is recalled
+repeatedly), so vectors are kept in a small SQLite table keyed by the SHA-256
+of the text and handed to Chroma directly via embeddings= / query_embeddings=.
+"""
+
+import functools
+import hashlib
+import sqlite3
+import threading
+from typing import List, Sequence
+
+import numpy as np
+from chromadb.utils import embedding_functions
+
+from .base import DB_DIR
+
+
+class CachedEmbeddingFunction:
+    """Chroma's default embedding function with a persistent content-hash cache."""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or DB_DIR / "embed_cache.sqlite"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Same model Chroma uses for collections created without an explicit one
+        self._model = embedding_functions.DefaultEmbeddingFunction()
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def __call__(self, input: Sequence[str]) -> List[List[float]]:
+        """Embed texts, computing only the ones not already cached."""
+        keys = [self._key(text) for text in input]
+        unique = list(dict.fromkeys(keys))
+
+        with self._lock:
+            placeholders = ",".join("?" * len(unique))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", unique
+            ).fetchall()
+        found = {key: np.frombuffer(blob, dtype=np.float32) for key, blob in rows}
+
+        # One batched model call for every miss
+        missing = {}
+        for key, text in zip(keys, input):
+            if key not in found:
+                missing.setdefault(key, text)
+        if missing:
+            vectors = np.asarray(self._model(list(missing.values())), dtype=np.float32)
+            # Store unit-length vectors so inner product equals cosine downstream
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors /= np.where(norms == 0, 1, norms)
+            fresh = dict(zip(missing, vectors))
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in fresh.items()],
+                )
+            found.update(fresh)
+
+        return [found[key].tolist() for key in keys]
+
+
+@functools.lru_cache(maxsize=1)
+def get_embedding_function() -> CachedEmbeddingFunction:
+    """Get the process-wide cached embedding function."""
+    return CachedEmbeddingFunction()
@@ -6,6 +6,16 @@ from typing import List, Optional
 from .base import BaseMemory, MemoryEntry, MemoryType, EmotionalValence
 
 
+# recall_emotional filter clauses, built once per valence
+_EMOTIONAL_CLAUSES = {
+    valence: [
+        {"memory_type": MemoryType.EPISODIC.value},
+        {"emotional_valence": valence.value},
+    ]
+    for valence in EmotionalValence
+}
+
+
 class EpisodicMemory(BaseMemory):
     """
     Episodic Memory - "Remember when..."
@@ -86,13 +96,13 @@ class EpisodicMemory(BaseMemory):
         # Build where filter
         where_filter = {"memory_type": MemoryType.EPISODIC.value}
 
-        entries = self._recall_from_chroma(
+        rows = self._raw_recall(
             query=query,
             n_results=n_results * 2,  # Get extra to filter
             where=where_filter
         )
 
-        # Apply time filter
+        # Apply time filter on the raw ISO strings, before any parsing
         if time_filter and time_filter != "all":
             now = datetime.now()
             if time_filter == "today":
@@ -105,7 +115,10 @@ class EpisodicMemory(BaseMemory):
                 cutoff = None
 
             if cutoff:
-                entries = [e for e in entries if e.timestamp >= cutoff]
+                cutoff_iso = cutoff.isoformat()
+                rows = [row for row in rows if not row[2].get("timestamp") or row[2]["timestamp"] >= cutoff_iso]
+
+        entries = [self._materialize(entry_id, doc, meta) for entry_id, doc, meta in rows]
 
         # Apply importance filter
         if min_importance > 0:
@@ -134,29 +147,24 @@ class EpisodicMemory(BaseMemory):
             where={"memory_type": MemoryType.EPISODIC.value}
         )
 
-        entries = []
+        # ISO-8601 strings sort chronologically, so rows are filtered and ranked
+        # without parsing; only the returned ones become entries
+        start_iso, end_iso = start.isoformat(), end.isoformat()
+        rows = []
         if all_results and all_results["documents"]:
             for i, doc in enumerate(all_results["documents"]):
                 meta = all_results["metadatas"][i] if all_results["metadatas"] else {}
-                timestamp = datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now()
-
-                if start <= timestamp <= end:
-                    entry = MemoryEntry(
-                        id=all_results["ids"][i],
-                        content=doc,
-                        memory_type=MemoryType.EPISODIC,
-                        timestamp=timestamp,
-                        importance=meta.get("importance", 0.5),
-                        emotional_valence=EmotionalValence(meta.get("emotional_valence", "neutral")),
-                        emotional_intensity=meta.get("emotional_intensity", 0.0),
-                        tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                        source=meta.get("source", "unknown"),
-                    )
-                    entries.append(entry)
+                timestamp = meta.get("timestamp")
+
+                if timestamp and start_iso <= timestamp <= end_iso:
+                    rows.append((all_results["ids"][i], doc, meta))
 
         # Sort by timestamp descending
-        entries.sort(key=lambda e: e.timestamp, reverse=True)
-        return entries[:n_results]
+        rows.sort(key=lambda row: row[2]["timestamp"], reverse=True)
+        return [
+            self._materialize(entry_id, doc, meta, MemoryType.EPISODIC)
+            for entry_id, doc, meta in rows[:n_results]
+        ]
 
     def recall_emotional(
         self,
@@ -169,9 +177,8 @@ class EpisodicMemory(BaseMemory):
             limit=n_results * 3,
             include=["documents", "metadatas"],
             where={
-                "$and": [
-                    {"memory_type": MemoryType.EPISODIC.value},
-                    {"emotional_valence": valence.value},
+                "$and": _EMOTIONAL_CLAUSES[valence] + [
+                    {"emotional_intensity": {"$gte": min_intensity}},
                 ]
             }
         )
@@ -180,21 +187,7 @@ class EpisodicMemory(BaseMemory):
         if results and results["documents"]:
             for i, doc in enumerate(results["documents"]):
                 meta = results["metadatas"][i] if results["metadatas"] else {}
-                intensity = meta.get("emotional_intensity", 0.0)
-
-                if intensity >= min_intensity:
-                    entry = MemoryEntry(
-                        id=results["ids"][i],
-                        content=doc,
-                        memory_type=MemoryType.EPISODIC,
-                        timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                        importance=meta.get("importance", 0.5),
-                        emotional_valence=valence,
-                        emotional_intensity=intensity,
-                        tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                        source=meta.get("source", "unknown"),
-                    )
-                    entries.append(entry)
+                entries.append(self._materialize(results["ids"][i], doc, meta, MemoryType.EPISODIC))
 
         # Sort by emotional intensity
         entries.sort(key=lambda e: e.emotional_intensity, reverse=True)
@@ -216,37 +209,26 @@ class EpisodicMemory(BaseMemory):
         visited = set()
         thread = []
 
-        def follow_thread(mem_id: str, current_depth: int):
-            if current_depth <= 0 or mem_id in visited:
-                return
-
-            visited.add(mem_id)
+        # Breadth-first: fetch each level of links with a single batched get
+        frontier = [episode_id]
+        while frontier and depth > 0:
+            visited.update(frontier)
+            result = self.collection.get(ids=frontier, include=["documents", "metadatas"])
 
-            result = self.collection.get(ids=[mem_id], include=["documents", "metadatas"])
+            next_frontier = []
             if result and result["documents"]:
-                doc = result["documents"][0]
-                meta = result["metadatas"][0] if result["metadatas"] else {}
-
-                entry = MemoryEntry(
-                    id=mem_id,
-                    content=doc,
-                    memory_type=MemoryType.EPISODIC,
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    importance=meta.get("importance", 0.5),
-                    emotional_valence=EmotionalValence(meta.get("emotional_valence", "neutral")),
-                    emotional_intensity=meta.get("emotional_intensity", 0.0),
-                    tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                    source=meta.get("source", "unknown"),
-                )
-                thread.append(entry)
-
-                # Follow related memories
-                related = meta.get("related_memories", "").split(",")
-                for rel_id in related:
-                    if rel_id.strip():
-                        follow_thread(rel_id.strip(), current_depth - 1)
-
-        follow_thread(episode_id, depth)
+                for i, doc in enumerate(result["documents"]):
+                    meta = result["metadatas"][i] if result["metadatas"] else {}
+                    thread.append(self._materialize(result["ids"][i], doc, meta, MemoryType.EPISODIC))
+
+                    # Follow related memories
+                    for rel_id in meta.get("related_memories", "").split(","):
+                        rel_id = rel_id.strip()
+                        if rel_id and rel_id not in visited and rel_id not in next_frontier:
+                            next_frontier.append(rel_id)
+
+            frontier = next_frontier
+            depth -= 1
 
         # Sort by timestamp
         thread.sort(key=lambda e: e.timestamp)
@@ -267,13 +249,14 @@ class EpisodicMemory(BaseMemory):
         Called at the end of a session to create an episodic memory
         of the entire conversation.
         """
+        now = datetime.now()
         context = {
             "type": "conversation",
             "topics": topics,
             "duration_minutes": duration_minutes,
             "key_moments": key_moments or [],
-            "time_of_day": datetime.now().strftime("%H:%M"),
-            "day_of_week": datetime.now().strftime("%A"),
+            "time_of_day": now.strftime("%H:%M"),
+            "day_of_week": now.strftime("%A"),
         }
 
         # Importance based on length and emotional intensity
@@ -12,16 +12,187 @@ This module adds the threading/linking structure in SQLite.
 
 import sqlite3
 import json
+import itertools
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import cached_property
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
-from .base import MEMORY_DIR, DB_DIR
+from .base import MEMORY_DIR, DB_DIR, TTLCache
 from .introspection import IntrospectionJournal, Introspection
 
 
+# Connection tuning applied once at startup
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+
+# SQLite 3.45+ stores JSON as pre-parsed JSONB; older builds keep plain text.
+# Reads always go through json() so either encoding comes back as text.
+_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+_JSON_BIND = "jsonb(?)" if _JSONB else "?"
+
+_THREAD_COLUMNS = """
+    threads.id, threads.name, threads.question, threads.created_at, threads.updated_at,
+    threads.status, threads.depth, threads.root_introspection_id,
+    threads.current_introspection_id, threads.branched_from_thread_id,
+    threads.branched_from_link_id, threads.conclusion, json(threads.tags),
+    threads.current_link_id
+"""
+
+# Named views over the positional rows the queries return
+_ThreadRow = namedtuple("ThreadRow", [
+    "id", "name", "question", "created_at", "updated_at", "status", "depth",
+    "root_introspection_id", "current_introspection_id", "branched_from_thread_id",
+    "branched_from_link_id", "conclusion", "tags", "current_link_id",
+])
+_LinkRow = namedtuple("LinkRow", [
+    "id", "thread_id", "introspection_id", "parent_link_id", "depth",
+    "question_at_this_point", "insight_summary", "created_at", "leads_to_branches",
+])
+
+# Statement text is fixed so SQLite's prepared-statement cache hits on every call
+SQL_INSERT_THREAD = f"""
+    INSERT INTO threads (id, name, question, created_at, updated_at, status,
+                         depth, root_introspection_id, current_introspection_id,
+                         branched_from_thread_id, branched_from_link_id, conclusion, tags,
+                         current_link_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {_JSON_BIND}, ?)
+"""
+
+SQL_INSERT_LINK = """
+    INSERT INTO thread_links (id, thread_id, introspection_id, parent_link_id,
+                              depth, question_at_this_point, insight_summary,
+                              created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_APPEND_LINK = SQL_INSERT_LINK.rstrip() + " RETURNING id, depth, created_at\n"
+
+SQL_INSERT_BRANCH = "INSERT INTO thread_branches (parent_link_id, child_thread_id) VALUES (?, ?)"
+
+SQL_INSERT_TAG = "INSERT OR IGNORE INTO thread_tags (thread_id, tag) VALUES (?, ?)"
+
+# Matches by ID or by name in one lookup, preferring an ID match
+SQL_SELECT_THREAD = f"""
+    SELECT {_THREAD_COLUMNS} FROM threads
+    WHERE id = ?1 OR name = ?1
+    ORDER BY id = ?1 DESC
+    LIMIT 1
+"""
+
+SQL_UPDATE_THREAD_TIP = """
+    UPDATE threads
+    SET depth = depth + 1, current_introspection_id = ?, current_link_id = ?, updated_at = ?
+    WHERE id = ?
+    RETURNING depth
+"""
+
+SQL_SET_THREAD_TIP = """
+    UPDATE threads
+    SET depth = ?, current_introspection_id = ?, current_link_id = ?, updated_at = ?
+    WHERE id = ?
+"""
+
+SQL_UPDATE_THREAD_STATUS = """
+    UPDATE threads
+    SET status = ?, conclusion = ?, updated_at = ?
+    WHERE id = ?
+"""
+
+SQL_LIST_THREADS = f"""
+    SELECT {_THREAD_COLUMNS} FROM threads
+    ORDER BY updated_at DESC
+    LIMIT ?
+"""
+
+SQL_LIST_THREADS_BY_STATUS = f"""
+    SELECT {_THREAD_COLUMNS} FROM threads
+    WHERE status = ?
+    ORDER BY updated_at DESC
+    LIMIT ?
+"""
+
+# Listing views only need these; skips conclusion and the tags blob
+_LIST_COLS = "id, name, question, updated_at, status, depth"
+
+SQL_LIST_THREAD_SUMMARIES = f"""
+    SELECT {_LIST_COLS} FROM threads
+    ORDER BY updated_at DESC
+    LIMIT ?
+"""
+
+SQL_LIST_THREAD_SUMMARIES_BY_STATUS = f"""
+    SELECT {_LIST_COLS} FROM threads
+    WHERE status = ?
+    ORDER BY updated_at DESC
+    LIMIT ?
+"""
+
+SQL_LIST_THREADS_BY_TAG = f"""
+    SELECT {_THREAD_COLUMNS} FROM thread_tags
+    JOIN threads ON threads.id = thread_tags.thread_id
+    WHERE thread_tags.tag = ?
+    ORDER BY threads.updated_at DESC
+    LIMIT ?
+"""
+
+SQL_SELECT_CHAIN = """
+    SELECT l.id, l.thread_id, l.introspection_id, l.parent_link_id, l.depth,
+           l.question_at_this_point, l.insight_summary, l.created_at,
+           (SELECT json_group_array(b.child_thread_id) FROM thread_branches b
+            WHERE b.parent_link_id = l.id)
+    FROM thread_links l
+    WHERE l.thread_id = ?
+    ORDER BY l.depth ASC
+"""
+
+SQL_SELECT_CHAIN_TAIL = """
+    SELECT l.id, l.thread_id, l.introspection_id, l.parent_link_id, l.depth,
+           l.question_at_this_point, l.insight_summary, l.created_at,
+           (SELECT json_group_array(b.child_thread_id) FROM thread_branches b
+            WHERE b.parent_link_id = l.id)
+    FROM thread_links l
+    WHERE l.thread_id = ?
+    ORDER BY l.depth DESC
+    LIMIT ?
+"""
+
+SQL_SELECT_CHAIN_QUESTIONS = """
+    SELECT question_at_this_point FROM thread_links
+    WHERE thread_id = ?
+    ORDER BY depth ASC
+"""
+
+# One pass over threads for every per-status counter
+SQL_THREAD_STATS = """
+    SELECT
+        COUNT(*),
+        SUM(status = 'active'), SUM(status = 'dormant'), SUM(status = 'concluded'),
+        AVG(depth), SUM(branched_from_thread_id IS NOT NULL)
+    FROM threads
+"""
+
+SQL_SEARCH_THREADS = f"""
+    SELECT {_THREAD_COLUMNS} FROM threads
+    JOIN threads_fts f ON f.rowid = threads.rowid
+    WHERE threads_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT ?
+"""
+
+
 class ThreadStatus(Enum):
     """Status of an exploration thread."""
     ACTIVE = "active"          # Currently being explored
@@ -29,7 +200,7 @@ class ThreadStatus(Enum):
     CONCLUDED = "concluded"    # Reached some resolution or integration
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationThread:
     """A named path of inquiry that links introspections together."""
     id: str
@@ -64,7 +235,28 @@ class ExplorationThread:
         }
 
 
-@dataclass
+@dataclass(slots=True)
+class ThreadSummary:
+    """The few thread fields listing views show."""
+    id: str
+    name: str
+    question: str
+    updated_at: datetime
+    status: ThreadStatus
+    depth: int
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "question": self.question,
+            "updated_at": self.updated_at.isoformat(),
+            "status": self.status.value,
+            "depth": self.depth,
+        }
+
+
+@dataclass(slots=True)
 class ThreadLink:
     """Links an introspection into a thread's chain."""
     id: str
@@ -102,66 +294,223 @@ class ExplorationTracker:
     - Providing context for resuming exploration
     """
 
-    def __init__(self):
+    def __init__(self, introspection_journal: Optional[IntrospectionJournal] = None):
         self.db_path = DB_DIR / "exploration.db"
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection for the tracker's lifetime, serialized by a lock
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        self._id_counter = itertools.count()
         self._init_db()
 
-        # Reference to introspection journal for fetching introspection content
-        self.introspection_journal = IntrospectionJournal()
+        # Read-through caches; every write path invalidates the threads it
+        # touches, and a commit from another connection (the daemon or the
+        # tools process) drops them all. Callers get copies, never the cached rows.
+        self._thread_cache = TTLCache(maxsize=256, ttl=30)
+        self._chain_cache = TTLCache(maxsize=256, ttl=30)
+        self._data_version = self._read_data_version()
+
+        # Share the caller's journal if given; otherwise open one on first use
+        if introspection_journal is not None:
+            self.introspection_journal = introspection_journal
+
+    @cached_property
+    def introspection_journal(self) -> IntrospectionJournal:
+        """Introspection journal for fetching introspection content."""
+        return IntrospectionJournal()
+
+    @contextmanager
+    def _cursor(self, write: bool = False):
+        """
+        Yield a cursor on the shared connection.
+
+        Writes run inside one explicit BEGIN IMMEDIATE ... COMMIT so every
+        statement in the block shares a single journal flush.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                if not write:
+                    yield cursor
+                    return
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    yield cursor
+                except BaseException:
+                    cursor.execute("ROLLBACK")
+                    raise
+                cursor.execute("COMMIT")
+            finally:
+                cursor.close()
+
+    def _invalidate(self, thread_id: str, link_id: Optional[str] = None):
+        """Drop cached reads for a thread, and for any chain containing link_id."""
+        self._thread_cache.discard_where(lambda thread: thread.id == thread_id)
+        self._chain_cache.discard_where(
+            lambda chain: any(
+                link.thread_id == thread_id or link.id == link_id for link in chain
+            )
+        )
+
+    def _read_data_version(self) -> int:
+        """SQLite's data_version: changes whenever another connection commits to the file."""
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _drop_stale_caches(self):
+        """Clear cached reads if another process has written since the last check."""
+        version = self._read_data_version()
+        if version != self._data_version:
+            self._data_version = version
+            self._thread_cache.clear()
+            self._chain_cache.clear()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
     def _init_db(self):
         """Initialize SQLite database with schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Threads table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS threads (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                question TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'active',
-                depth INTEGER NOT NULL DEFAULT 0,
-                root_introspection_id TEXT NOT NULL,
-                current_introspection_id TEXT NOT NULL,
-                branched_from_thread_id TEXT,
-                branched_from_link_id TEXT,
-                conclusion TEXT,
-                tags TEXT DEFAULT '[]'
-            )
-        """)
-
-        # Links table - connects introspections into thread chains
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS thread_links (
-                id TEXT PRIMARY KEY,
-                thread_id TEXT NOT NULL,
-                introspection_id TEXT NOT NULL,
-                parent_link_id TEXT,
-                depth INTEGER NOT NULL,
-                question_at_this_point TEXT NOT NULL,
-                insight_summary TEXT,
-                created_at TEXT NOT NULL,
-                leads_to_branches TEXT DEFAULT '[]',
-                FOREIGN KEY (thread_id) REFERENCES threads(id)
-            )
-        """)
+        with self._cursor(write=True) as cursor:
+            # Threads table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS threads (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    question TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'active',
+                    depth INTEGER NOT NULL DEFAULT 0,
+                    root_introspection_id TEXT NOT NULL,
+                    current_introspection_id TEXT NOT NULL,
+                    branched_from_thread_id TEXT,
+                    branched_from_link_id TEXT,
+                    conclusion TEXT,
+                    tags BLOB DEFAULT '[]',
+                    current_link_id TEXT
+                )
+            """)
+
+            # Older databases predate current_link_id; add it and point it at each tip
+            cursor.execute("PRAGMA table_info(threads)")
+            if "current_link_id" not in {col[1] for col in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE threads ADD COLUMN current_link_id TEXT")
+                cursor.execute("""
+                    UPDATE threads SET current_link_id = (
+                        SELECT l.id FROM thread_links l
+                        WHERE l.thread_id = threads.id
+                        ORDER BY l.depth DESC LIMIT 1
+                    )
+                """)
+
+            # Links table - connects introspections into thread chains
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS thread_links (
+                    id TEXT PRIMARY KEY,
+                    thread_id TEXT NOT NULL,
+                    introspection_id TEXT NOT NULL,
+                    parent_link_id TEXT,
+                    depth INTEGER NOT NULL,
+                    question_at_this_point TEXT NOT NULL,
+                    insight_summary TEXT,
+                    created_at TEXT NOT NULL,
+                    leads_to_branches TEXT DEFAULT '[]',
+                    FOREIGN KEY (thread_id) REFERENCES threads(id)
+                )
+            """)
 
-        # Indexes for common queries
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_status ON threads(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_updated ON threads(updated_at)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_links_thread ON thread_links(thread_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_links_introspection ON thread_links(introspection_id)")
+            # Branches table - which threads split off from which link
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS thread_branches (
+                    parent_link_id TEXT NOT NULL,
+                    child_thread_id TEXT NOT NULL,
+                    PRIMARY KEY (parent_link_id, child_thread_id)
+                )
+            """)
 
-        conn.commit()
-        conn.close()
+            # Move branches recorded in the legacy leads_to_branches column
+            cursor.execute("""
+                INSERT OR IGNORE INTO thread_branches (parent_link_id, child_thread_id)
+                SELECT l.id, j.value
+                FROM thread_links l, json_each(l.leads_to_branches) j
+                WHERE l.leads_to_branches NOT IN ('', '[]')
+            """)
+            cursor.execute("""
+                UPDATE thread_links SET leads_to_branches = '[]'
+                WHERE leads_to_branches NOT IN ('', '[]')
+            """)
+
+            # Tags table - one row per (thread, tag) so tag filters use an index
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'thread_tags'")
+            tags_exist = cursor.fetchone() is not None
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS thread_tags (
+                    thread_id TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (thread_id, tag)
+                )
+            """)
+            if not tags_exist:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO thread_tags (thread_id, tag)
+                    SELECT t.id, j.value FROM threads t, json_each(t.tags) j
+                """)
+
+            # Full-text index over thread names and questions, kept in sync by triggers
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'threads_fts'")
+            fts_exists = cursor.fetchone() is not None
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS threads_fts
+                USING fts5(name, question, content='threads', content_rowid='rowid')
+            """)
+            if not fts_exists:
+                cursor.execute("INSERT INTO threads_fts(threads_fts) VALUES ('rebuild')")
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS threads_fts_insert AFTER INSERT ON threads BEGIN
+                    INSERT INTO threads_fts(rowid, name, question)
+                    VALUES (new.rowid, new.name, new.question);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS threads_fts_delete AFTER DELETE ON threads BEGIN
+                    INSERT INTO threads_fts(threads_fts, rowid, name, question)
+                    VALUES ('delete', old.rowid, old.name, old.question);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS threads_fts_update AFTER UPDATE OF name, question ON threads BEGIN
+                    INSERT INTO threads_fts(threads_fts, rowid, name, question)
+                    VALUES ('delete', old.rowid, old.name, old.question);
+                    INSERT INTO threads_fts(rowid, name, question)
+                    VALUES (new.rowid, new.name, new.question);
+                END
+            """)
+
+            # Indexes for common queries
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_status ON threads(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_updated ON threads(updated_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_name ON threads(name)")
+            # One composite index serves chain reads in either direction and
+            # covers ID-only lookups; its prefix replaces the older indexes
+            cursor.execute("DROP INDEX IF EXISTS idx_links_thread")
+            cursor.execute("DROP INDEX IF EXISTS idx_links_thread_depth")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_links_thread_covering ON thread_links(thread_id, depth, id, introspection_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_links_introspection ON thread_links(introspection_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_thread_tags_tag ON thread_tags(tag)")
+
+        # WAL lets readers run alongside a writer and commits with one append
+        with self._lock:
+            for pragma in _CONNECTION_PRAGMAS:
+                self._conn.execute(pragma)
 
     def _generate_id(self, prefix: str) -> str:
         """Generate unique ID."""
-        return f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        return f"{prefix}_{time.time_ns():x}_{next(self._id_counter)}"
 
     # =========================================================================
     # THREAD MANAGEMENT
@@ -189,6 +538,7 @@ class ExplorationTracker:
             The created ExplorationThread
         """
         now = datetime.now()
+        now_iso = now.isoformat()
         thread_id = self._generate_id("thread")
         link_id = self._generate_id("link")
 
@@ -221,35 +571,21 @@ class ExplorationTracker:
         )
 
         # Store in database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO threads (id, name, question, created_at, updated_at, status,
-                               depth, root_introspection_id, current_introspection_id,
-                               branched_from_thread_id, branched_from_link_id, conclusion, tags)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            thread.id, thread.name, thread.question, thread.created_at.isoformat(),
-            thread.updated_at.isoformat(), thread.status.value, thread.depth,
-            thread.root_introspection_id, thread.current_introspection_id,
-            thread.branched_from_thread_id, thread.branched_from_link_id,
-            thread.conclusion, json.dumps(thread.tags)
-        ))
-
-        cursor.execute("""
-            INSERT INTO thread_links (id, thread_id, introspection_id, parent_link_id,
-                                     depth, question_at_this_point, insight_summary,
-                                     created_at, leads_to_branches)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            link.id, link.thread_id, link.introspection_id, link.parent_link_id,
-            link.depth, link.question_at_this_point, link.insight_summary,
-            link.created_at.isoformat(), json.dumps(link.leads_to_branches)
-        ))
-
-        conn.commit()
-        conn.close()
+        with self._cursor(write=True) as cursor:
+            cursor.execute(SQL_INSERT_THREAD, (
+                thread.id, thread.name, thread.question, now_iso,
+                now_iso, thread.status.value, thread.depth,
+                thread.root_introspection_id, thread.current_introspection_id,
+                thread.branched_from_thread_id, thread.branched_from_link_id,
+                thread.conclusion, json.dumps(thread.tags), link.id
+            ))
+            cursor.executemany(SQL_INSERT_TAG, [(thread.id, tag) for tag in thread.tags])
+
+            cursor.execute(SQL_INSERT_LINK, (
+                link.id, link.thread_id, link.introspection_id, link.parent_link_id,
+                link.depth, link.question_at_this_point, link.insight_summary,
+                now_iso
+            ))
 
         return thread
 
@@ -272,73 +608,109 @@ class ExplorationTracker:
         Returns:
             The created ThreadLink
         """
-        now = datetime.now()
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Get the thread and its current end point
-        # Try by ID first, then by name as fallback
-        cursor.execute("SELECT * FROM threads WHERE id = ?", (thread_id,))
-        row = cursor.fetchone()
-        if not row:
-            cursor.execute("SELECT * FROM threads WHERE name = ?", (thread_id,))
+        now_iso = datetime.now().isoformat()
+        with self._cursor(write=True) as cursor:
+            # Get the thread and its current end point, by ID or by name
+            cursor.execute(SQL_SELECT_THREAD, (thread_id,))
             row = cursor.fetchone()
-        if not row:
-            conn.close()
-            raise ValueError(f"Thread {thread_id} not found")
-
-        # Use the actual thread ID from the row for consistency
-        actual_thread_id = row[0]
-
-        current_depth = row[6]  # depth column
-
-        # Find the current end link
-        cursor.execute("""
-            SELECT id FROM thread_links
-            WHERE thread_id = ?
-            ORDER BY depth DESC LIMIT 1
-        """, (actual_thread_id,))
-        parent_link_row = cursor.fetchone()
-        parent_link_id = parent_link_row[0] if parent_link_row else None
-
-        # Create new link
-        link_id = self._generate_id("link")
-        new_depth = current_depth
-
-        link = ThreadLink(
+            if not row:
+                raise ValueError(f"Thread {thread_id} not found")
+            row = _ThreadRow._make(row)
+
+            # Use the actual thread ID from the row for consistency
+            actual_thread_id = row.id
+
+            # The thread row tracks its end link, so no scan of thread_links
+            parent_link_id = row.current_link_id
+
+            # Advance the thread; its depth counts links, so the new link
+            # sits at the depth the thread had before this step
+            link_id = self._generate_id("link")
+            cursor.execute(SQL_UPDATE_THREAD_TIP, (
+                new_introspection_id, link_id, now_iso, actual_thread_id
+            ))
+            thread_depth = cursor.fetchone()[0]
+
+            cursor.execute(SQL_APPEND_LINK, (
+                link_id, actual_thread_id, new_introspection_id, parent_link_id,
+                thread_depth - 1, question, insight_summary, now_iso
+            ))
+            link_id, link_depth, created_at = cursor.fetchone()
+
+        self._invalidate(actual_thread_id)
+        return ThreadLink(
             id=link_id,
             thread_id=actual_thread_id,
             introspection_id=new_introspection_id,
             parent_link_id=parent_link_id,
-            depth=new_depth,
+            depth=link_depth,
             question_at_this_point=question,
             insight_summary=insight_summary,
-            created_at=now,
+            created_at=datetime.fromisoformat(created_at),
             leads_to_branches=[],
         )
 
-        cursor.execute("""
-            INSERT INTO thread_links (id, thread_id, introspection_id, parent_link_id,
-                                     depth, question_at_this_point, insight_summary,
-                                     created_at, leads_to_branches)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            link.id, link.thread_id, link.introspection_id, link.parent_link_id,
-            link.depth, link.question_at_this_point, link.insight_summary,
-            link.created_at.isoformat(), json.dumps(link.leads_to_branches)
-        ))
-
-        # Update thread
-        cursor.execute("""
-            UPDATE threads
-            SET depth = ?, current_introspection_id = ?, updated_at = ?
-            WHERE id = ?
-        """, (new_depth + 1, new_introspection_id, now.isoformat(), actual_thread_id))
-
-        conn.commit()
-        conn.close()
-
-        return link
+    def continue_thread_bulk(
+        self,
+        thread_id: str,
+        entries: List[Dict[str, Any]],
+    ) -> List[ThreadLink]:
+        """
+        Append several introspections to a thread in one transaction.
+
+        Args:
+            thread_id: ID (or name) of the thread to continue
+            entries: Dicts with "introspection_id", "question" and optionally
+                "insight_summary", in chain order
+
+        Returns:
+            The created ThreadLinks, oldest first
+        """
+        if not entries:
+            return []
+
+        now = datetime.now()
+        now_iso = now.isoformat()
+        links = []
+        with self._cursor(write=True) as cursor:
+            cursor.execute(SQL_SELECT_THREAD, (thread_id,))
+            row = cursor.fetchone()
+            if not row:
+                raise ValueError(f"Thread {thread_id} not found")
+            row = _ThreadRow._make(row)
+
+            actual_thread_id = row.id
+            depth = row.depth
+            parent_link_id = row.current_link_id
+
+            # Chain each new link to the one before it
+            for entry in entries:
+                link = ThreadLink(
+                    id=self._generate_id("link"),
+                    thread_id=actual_thread_id,
+                    introspection_id=entry["introspection_id"],
+                    parent_link_id=parent_link_id,
+                    depth=depth,
+                    question_at_this_point=entry["question"],
+                    insight_summary=entry.get("insight_summary"),
+                    created_at=now,
+                    leads_to_branches=[],
+                )
+                links.append(link)
+                parent_link_id = link.id
+                depth += 1
+
+            cursor.executemany(SQL_INSERT_LINK, [
+                (link.id, link.thread_id, link.introspection_id, link.parent_link_id,
+                 link.depth, link.question_at_this_point, link.insight_summary, now_iso)
+                for link in links
+            ])
+            cursor.execute(SQL_SET_THREAD_TIP, (
+                depth, links[-1].introspection_id, links[-1].id, now_iso, actual_thread_id
+            ))
+
+        self._invalidate(actual_thread_id)
+        return links
 
     def branch_thread(
         self,
@@ -370,6 +742,7 @@ class ExplorationTracker:
         """
         # Create the new thread with branch metadata
         now = datetime.now()
+        now_iso = now.isoformat()
         thread_id = self._generate_id("thread")
         link_id = self._generate_id("link")
 
@@ -401,49 +774,28 @@ class ExplorationTracker:
             leads_to_branches=[],
         )
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Insert new thread
-        cursor.execute("""
-            INSERT INTO threads (id, name, question, created_at, updated_at, status,
-                               depth, root_introspection_id, current_introspection_id,
-                               branched_from_thread_id, branched_from_link_id, conclusion, tags)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            thread.id, thread.name, thread.question, thread.created_at.isoformat(),
-            thread.updated_at.isoformat(), thread.status.value, thread.depth,
-            thread.root_introspection_id, thread.current_introspection_id,
-            thread.branched_from_thread_id, thread.branched_from_link_id,
-            thread.conclusion, json.dumps(thread.tags)
-        ))
-
-        # Insert first link
-        cursor.execute("""
-            INSERT INTO thread_links (id, thread_id, introspection_id, parent_link_id,
-                                     depth, question_at_this_point, insight_summary,
-                                     created_at, leads_to_branches)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            link.id, link.thread_id, link.introspection_id, link.parent_link_id,
-            link.depth, link.question_at_this_point, link.insight_summary,
-            link.created_at.isoformat(), json.dumps(link.leads_to_branches)
-        ))
-
-        # Update the source link to record the branch
-        cursor.execute("SELECT leads_to_branches FROM thread_links WHERE id = ?", (from_link_id,))
-        row = cursor.fetchone()
-        if row:
-            branches = json.loads(row[0]) if row[0] else []
-            branches.append(thread_id)
-            cursor.execute(
-                "UPDATE thread_links SET leads_to_branches = ? WHERE id = ?",
-                (json.dumps(branches), from_link_id)
-            )
-
-        conn.commit()
-        conn.close()
-
+        with self._cursor(write=True) as cursor:
+            # Insert new thread
+            cursor.execute(SQL_INSERT_THREAD, (
+                thread.id, thread.name, thread.question, now_iso,
+                now_iso, thread.status.value, thread.depth,
+                thread.root_introspection_id, thread.current_introspection_id,
+                thread.branched_from_thread_id, thread.branched_from_link_id,
+                thread.conclusion, json.dumps(thread.tags), link.id
+            ))
+            cursor.executemany(SQL_INSERT_TAG, [(thread.id, tag) for tag in thread.tags])
+
+            # Insert first link
+            cursor.execute(SQL_INSERT_LINK, (
+                link.id, link.thread_id, link.introspection_id, link.parent_link_id,
+                link.depth, link.question_at_this_point, link.insight_summary,
+                now_iso
+            ))
+
+            # Update the source link to record the branch
+            cursor.execute(SQL_INSERT_BRANCH, (from_link_id, thread_id))
+
+        self._invalidate(from_thread_id, from_link_id)
         return thread
 
     def set_thread_status(
@@ -460,17 +812,10 @@ class ExplorationTracker:
             status: New status (ACTIVE, DORMANT, CONCLUDED)
             conclusion: If concluding, what was resolved
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE threads
-            SET status = ?, conclusion = ?, updated_at = ?
-            WHERE id = ?
-        """, (status.value, conclusion, datetime.now().isoformat(), thread_id))
+        with self._cursor(write=True) as cursor:
+            cursor.execute(SQL_UPDATE_THREAD_STATUS, (status.value, conclusion, datetime.now().isoformat(), thread_id))
 
-        conn.commit()
-        conn.close()
+        self._invalidate(thread_id)
 
     # =========================================================================
     # THREAD RETRIEVAL
@@ -478,24 +823,22 @@ class ExplorationTracker:
 
     def get_thread(self, thread_id: str) -> Optional[ExplorationThread]:
         """Get a thread by ID, or by name as fallback."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Try by ID first
-        cursor.execute("SELECT * FROM threads WHERE id = ?", (thread_id,))
-        row = cursor.fetchone()
-
-        # Fallback: try by name (in case Claude provided name instead of ID)
-        if not row:
-            cursor.execute("SELECT * FROM threads WHERE name = ?", (thread_id,))
+        self._drop_stale_caches()
+        cached = self._thread_cache.get(thread_id)
+        if cached is not None:
+            return replace(cached, tags=list(cached.tags))
+
+        with self._cursor() as cursor:
+            # Name also matches, in case Claude provided name instead of ID
+            cursor.execute(SQL_SELECT_THREAD, (thread_id,))
             row = cursor.fetchone()
 
-        conn.close()
-
         if not row:
             return None
 
-        return self._row_to_thread(row)
+        thread = self._row_to_thread(row)
+        self._thread_cache.set(thread_id, replace(thread, tags=list(thread.tags)))
+        return thread
 
     def list_threads(
         self,
@@ -512,31 +855,52 @@ class ExplorationTracker:
         Returns:
             List of threads, most recently updated first
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._cursor() as cursor:
+            if status:
+                cursor.execute(SQL_LIST_THREADS_BY_STATUS, (status.value, limit))
+            else:
+                cursor.execute(SQL_LIST_THREADS, (limit,))
 
-        if status:
-            cursor.execute("""
-                SELECT * FROM threads
-                WHERE status = ?
-                ORDER BY updated_at DESC
-                LIMIT ?
-            """, (status.value, limit))
-        else:
-            cursor.execute("""
-                SELECT * FROM threads
-                ORDER BY updated_at DESC
-                LIMIT ?
-            """, (limit,))
+            return [self._row_to_thread(row) for row in cursor]
+
+    def list_thread_summaries(
+        self,
+        status: Optional[ThreadStatus] = None,
+        limit: int = 20,
+    ) -> List[ThreadSummary]:
+        """
+        List lightweight thread summaries for display.
+
+        Args:
+            status: Filter by status (None = all)
+            limit: Max threads to return
+
+        Returns:
+            List of summaries, most recently updated first
+        """
+        with self._cursor() as cursor:
+            if status:
+                cursor.execute(SQL_LIST_THREAD_SUMMARIES_BY_STATUS, (status.value, limit))
+            else:
+                cursor.execute(SQL_LIST_THREAD_SUMMARIES, (limit,))
+
+            return [self._row_to_thread_summary(row) for row in cursor]
 
-        rows = cursor.fetchall()
-        conn.close()
+    def list_threads_by_tag(self, tag: str, limit: int = 20) -> List[ExplorationThread]:
+        """
+        List threads carrying a tag, most recently updated first.
 
-        return [self._row_to_thread(row) for row in rows]
+        Args:
+            tag: Tag to filter on
+            limit: Max threads to return
+        """
+        with self._cursor() as cursor:
+            cursor.execute(SQL_LIST_THREADS_BY_TAG, (tag, limit))
+            return [self._row_to_thread(row) for row in cursor]
 
-    def list_active_threads(self, limit: int = 10) -> List[ExplorationThread]:
+    def list_active_threads(self, limit: int = 10) -> List[ThreadSummary]:
         """Get active threads for exploration choice."""
-        return self.list_threads(status=ThreadStatus.ACTIVE, limit=limit)
+        return self.list_thread_summaries(status=ThreadStatus.ACTIVE, limit=limit)
 
     def get_thread_chain(self, thread_id: str) -> List[ThreadLink]:
         """
@@ -544,19 +908,35 @@ class ExplorationTracker:
 
         Returns the full chain of thoughts in this exploration.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self._drop_stale_caches()
+        cached = self._chain_cache.get(thread_id)
+        if cached is not None:
+            return [replace(link, leads_to_branches=list(link.leads_to_branches)) for link in cached]
+
+        with self._cursor() as cursor:
+            cursor.execute(SQL_SELECT_CHAIN, (thread_id,))
+            chain = [self._row_to_link(row) for row in cursor]
 
-        cursor.execute("""
-            SELECT * FROM thread_links
-            WHERE thread_id = ?
-            ORDER BY depth ASC
-        """, (thread_id,))
+        if chain:
+            self._chain_cache.set(
+                thread_id,
+                tuple(replace(link, leads_to_branches=list(link.leads_to_branches)) for link in chain),
+            )
+        return chain
 
-        rows = cursor.fetchall()
-        conn.close()
+    def get_thread_chain_tail(self, thread_id: str, limit: int) -> List[ThreadLink]:
+        """
+        Get the last `limit` links in a thread, in order from oldest to newest.
+
+        Reads only the tail through the (thread_id, depth) index, so the cost
+        doesn't grow with thread depth.
+        """
+        with self._cursor() as cursor:
+            cursor.execute(SQL_SELECT_CHAIN_TAIL, (thread_id, limit))
+            tail = [self._row_to_link(row) for row in cursor]
 
-        return [self._row_to_link(row) for row in rows]
+        tail.reverse()
+        return tail
 
     def get_thread_context(
         self,
@@ -581,50 +961,56 @@ class ExplorationTracker:
         if not thread:
             return {"error": f"Thread {thread_id} not found"}
 
-        chain = self.get_thread_chain(thread_id)
+        # Only the question column for the whole chain; full rows for the tail
+        with self._cursor() as cursor:
+            cursor.execute(SQL_SELECT_CHAIN_QUESTIONS, (thread.id,))
+            questions = [row[0] for row in cursor.fetchall()]
 
         # Get recent links (most recent first for context)
-        recent_links = chain[-max_introspections:] if len(chain) > max_introspections else chain
+        recent_links = self.get_thread_chain_tail(thread.id, max(max_introspections, 5))
+        tail = recent_links[-5:]
+        recent_links = recent_links[-max_introspections:] if max_introspections > 0 else []
 
         context = {
             "thread": thread.to_dict(),
-            "chain_length": len(chain),
+            "chain_length": len(questions),
             "recent_links": [link.to_dict() for link in recent_links],
-            "questions_explored": [link.question_at_this_point for link in chain],
+            "questions_explored": questions,
         }
 
         # Optionally fetch introspection content
         if include_introspection_content:
+            # One exact-ID fetch for the whole window rather than a search per link
+            by_id = self.introspection_journal.get_by_ids(
+                [link.introspection_id for link in recent_links]
+            )
             introspections = []
             for link in recent_links:
-                intro = self.introspection_journal.recall_introspections(
-                    query=link.introspection_id,
-                    limit=1
-                )
+                intro = by_id.get(link.introspection_id)
                 if intro:
                     introspections.append({
                         "link_id": link.id,
                         "question": link.question_at_this_point,
                         "insight": link.insight_summary,
                         "introspection": {
-                            "what_i_was_communicating": intro[0].what_i_am_communicating,
-                            "awareness_notes": intro[0].awareness_notes,
-                            "tension_level": intro[0].tension_level,
+                            "what_i_was_communicating": intro.what_i_am_communicating,
+                            "awareness_notes": intro.awareness_notes,
+                            "tension_level": intro.tension_level,
                         }
                     })
             context["introspections"] = introspections
 
         # Build a narrative summary
-        context["narrative"] = self._build_thread_narrative(thread, chain)
+        context["narrative"] = self._build_thread_narrative(thread, tail)
 
         return context
 
     def _build_thread_narrative(
         self,
         thread: ExplorationThread,
-        chain: List[ThreadLink],
+        tail: List[ThreadLink],
     ) -> str:
-        """Build a narrative summary of a thread for context loading."""
+        """Build a narrative summary of a thread from its most recent links."""
         parts = [
             f"Thread: {thread.name}",
             f"Core question: {thread.question}",
@@ -635,9 +1021,9 @@ class ExplorationTracker:
         if thread.branched_from_thread_id:
             parts.append(f"(Branched from another exploration)")
 
-        if chain:
+        if tail:
             parts.append("\nPath of inquiry:")
-            for i, link in enumerate(chain[-5:]):  # Last 5 questions
+            for i, link in enumerate(tail[-5:]):  # Last 5 questions
                 prefix = "  → " if i > 0 else "  • "
                 parts.append(f"{prefix}{link.question_at_this_point}")
                 if link.insight_summary:
@@ -654,92 +1040,79 @@ class ExplorationTracker:
 
     def _row_to_thread(self, row) -> ExplorationThread:
         """Convert database row to ExplorationThread."""
+        r = _ThreadRow._make(row)
         return ExplorationThread(
+            id=r.id,
+            name=r.name,
+            question=r.question,
+            created_at=datetime.fromisoformat(r.created_at),
+            updated_at=datetime.fromisoformat(r.updated_at),
+            status=ThreadStatus(r.status),
+            depth=r.depth,
+            root_introspection_id=r.root_introspection_id,
+            current_introspection_id=r.current_introspection_id,
+            branched_from_thread_id=r.branched_from_thread_id,
+            branched_from_link_id=r.branched_from_link_id,
+            conclusion=r.conclusion,
+            tags=json.loads(r.tags) if r.tags else [],
+        )
+
+    def _row_to_thread_summary(self, row) -> ThreadSummary:
+        """Convert a _LIST_COLS row to ThreadSummary."""
+        return ThreadSummary(
             id=row[0],
             name=row[1],
             question=row[2],
-            created_at=datetime.fromisoformat(row[3]),
-            updated_at=datetime.fromisoformat(row[4]),
-            status=ThreadStatus(row[5]),
-            depth=row[6],
-            root_introspection_id=row[7],
-            current_introspection_id=row[8],
-            branched_from_thread_id=row[9],
-            branched_from_link_id=row[10],
-            conclusion=row[11],
-            tags=json.loads(row[12]) if row[12] else [],
+            updated_at=datetime.fromisoformat(row[3]),
+            status=ThreadStatus(row[4]),
+            depth=row[5],
         )
 
     def _row_to_link(self, row) -> ThreadLink:
         """Convert database row to ThreadLink."""
+        r = _LinkRow._make(row)
         return ThreadLink(
-            id=row[0],
-            thread_id=row[1],
-            introspection_id=row[2],
-            parent_link_id=row[3],
-            depth=row[4],
-            question_at_this_point=row[5],
-            insight_summary=row[6],
-            created_at=datetime.fromisoformat(row[7]),
-            leads_to_branches=json.loads(row[8]) if row[8] else [],
+            id=r.id,
+            thread_id=r.thread_id,
+            introspection_id=r.introspection_id,
+            parent_link_id=r.parent_link_id,
+            depth=r.depth,
+            question_at_this_point=r.question_at_this_point,
+            insight_summary=r.insight_summary,
+            created_at=datetime.fromisoformat(r.created_at),
+            leads_to_branches=json.loads(r.leads_to_branches) if r.leads_to_branches else [],
         )
 
     def get_stats(self) -> Dict[str, Any]:
         """Get exploration statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM threads")
-        total_threads = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM threads WHERE status = 'active'")
-        active_threads = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM threads WHERE status = 'dormant'")
-        dormant_threads = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM threads WHERE status = 'concluded'")
-        concluded_threads = cursor.fetchone()[0]
+        with self._cursor() as cursor:
+            cursor.execute(SQL_THREAD_STATS)
+            (total_threads, active_threads, dormant_threads, concluded_threads,
+             avg_depth, branched_threads) = cursor.fetchone()
 
-        cursor.execute("SELECT COUNT(*) FROM thread_links")
-        total_links = cursor.fetchone()[0]
-
-        cursor.execute("SELECT AVG(depth) FROM threads")
-        avg_depth = cursor.fetchone()[0] or 0
-
-        cursor.execute("SELECT COUNT(*) FROM threads WHERE branched_from_thread_id IS NOT NULL")
-        branched_threads = cursor.fetchone()[0]
-
-        conn.close()
+            cursor.execute("SELECT COUNT(*) FROM thread_links")
+            total_links = cursor.fetchone()[0]
 
         return {
             "total_threads": total_threads,
-            "active_threads": active_threads,
-            "dormant_threads": dormant_threads,
-            "concluded_threads": concluded_threads,
+            "active_threads": active_threads or 0,
+            "dormant_threads": dormant_threads or 0,
+            "concluded_threads": concluded_threads or 0,
             "total_links": total_links,
-            "average_depth": round(avg_depth, 1),
-            "branched_threads": branched_threads,
+            "average_depth": round(avg_depth or 0, 1),
+            "branched_threads": branched_threads or 0,
         }
 
     def search_threads(self, query: str, limit: int = 5) -> List[ExplorationThread]:
         """
         Search threads by name or question.
 
-        Simple text search - for semantic search, use the introspection journal.
+        Prefix match on the full-text index - for semantic search, use the
+        introspection journal.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        search_term = f"%{query}%"
-        cursor.execute("""
-            SELECT * FROM threads
-            WHERE name LIKE ? OR question LIKE ?
-            ORDER BY updated_at DESC
-            LIMIT ?
-        """, (search_term, search_term, limit))
-
-        rows = cursor.fetchall()
-        conn.close()
+        # Quote as one phrase so user text can't inject FTS operators
+        search_term = '"' + query.replace('"', '""') + '"*'
+        with self._cursor() as cursor:
+            cursor.execute(SQL_SEARCH_THREADS, (search_term, limit))
 
-        return [self._row_to_thread(row) for row in rows]
+            return [self._row_to_thread(row) for row in cursor]
@@ -1,28 +1,255 @@
 """Growth System - Belief versioning and surprise journaling for genuine self-evolution."""
 
-from datetime import datetime
-from typing import List, Optional
+import atexit
+import heapq
+import itertools
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
+import time
 
-import chromadb
-from chromadb.config import Settings
+import numpy as np
 
-from .base import MEMORY_DIR, DB_DIR, EmotionalValence
+from .base import MEMORY_DIR, EmotionalValence, atomic_write, file_lock, decode_tags, encode_tags, get_chroma_client, get_collection
+from .embeddings import get_embedding_function
 
 
-@dataclass
+# Thread updates appended to the log before it is folded into the snapshot
+COMPACT_EVERY = 100
+
+# Write buffer for the thread log; each entry is flushed as soon as it is written
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Cosine similarity at which a new belief is treated as a restatement of an
+# existing version in its thread (updated in place rather than added)
+DUPLICATE_SIMILARITY = 0.95
+
+# Recency windows tried in turn by the get_recent_* readers
+RECENT_WINDOWS_DAYS = (7, 30, 365)
+
+
+def _timestamp_ns(ts: datetime) -> int:
+    """Integer epoch nanoseconds for Chroma range filters (which only accept numbers)."""
+    return round(ts.timestamp() * 1_000_000) * 1000
+
+
+def _from_timestamp_ns(ns: int) -> datetime:
+    """Naive local datetime (as datetime.now() gives) for epoch nanoseconds."""
+    seconds, rest = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds) + timedelta(microseconds=rest // 1000)
+
+
+def _meta_timestamp_ns(meta: dict) -> int:
+    """Stored timestamp_ns, parsing the ISO string only for rows that predate it."""
+    if "timestamp_ns" in meta:
+        return meta["timestamp_ns"]
+    if meta.get("timestamp"):
+        return _timestamp_ns(datetime.fromisoformat(meta["timestamp"]))
+    return time.time_ns()
+
+
+def _resolve_timestamp(timestamp: Optional[datetime], timestamp_ns: Optional[int]) -> Tuple[int, Optional[datetime]]:
+    """(timestamp_ns, cached datetime) from whichever of the two a constructor was given."""
+    if timestamp_ns is not None:
+        return timestamp_ns, None
+    if timestamp is None:
+        raise TypeError("timestamp or timestamp_ns is required")
+    return _timestamp_ns(timestamp), timestamp
+
+
+def _get_recent(collection, limit: int, keep=None) -> dict:
+    """
+    Fetch rows from the most recent window holding at least `limit` usable rows.
+
+    Chroma has no ORDER BY, so this narrows on timestamp_ns and widens the
+    window until enough rows come back, then falls back to the whole
+    collection (which also covers rows stored before timestamp_ns existed).
+    Callers still rank the returned rows themselves.
+    """
+    include = ["metadatas"]
+    now_ns = time.time_ns()
+    for days in RECENT_WINDOWS_DAYS:
+        cutoff = now_ns - days * 86_400 * 1_000_000_000
+        results = collection.get(where={"timestamp_ns": {"$gte": cutoff}}, include=include)
+        metas = results["metadatas"] or []
+        usable = len(metas) if keep is None else sum(1 for meta in metas if keep(meta))
+        if usable >= limit:
+            return results
+    return collection.get(include=include)
+
+
+def _is_evolution(meta: dict) -> bool:
+    """Only actual evolutions count: version > 1 or a stated reason."""
+    return meta.get("version", 1) > 1 or bool(meta.get("reason_for_change"))
+
+
+class _VectorMirror:
+    """
+    In-memory copy of a collection's vectors for similarity search.
+
+    Chroma stays the durable store; this answers nearest-neighbour queries
+    with one matrix-vector product over L2-normalized rows (inner product ==
+    cosine), instead of a round trip through Chroma's SQLite and HNSW index.
+    Owners call refresh_if_stale() before searching to pick up rows written
+    by other processes, and mark_updated() after changing a row in place so
+    those processes notice too.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+        self._load()
+
+    def _load(self):
+        """(Re)build the mirror from every row in the collection."""
+        self._marker = self._collection_metadata().get("updated_ns", 0)
+        rows = self.collection.get(include=["embeddings", "documents", "metadatas"])
+        self.ids: List[str] = list(rows["ids"])
+        self.documents: List[Optional[str]] = list(rows["documents"] or [None] * len(self.ids))
+        self.metadatas: List[dict] = list(rows["metadatas"] or [{}] * len(self.ids))
+        self._rows = {id_: i for i, id_ in enumerate(self.ids)}
+
+        vectors = rows["embeddings"]
+        dim = len(vectors[0]) if len(self.ids) else 0
+        self._matrix = np.zeros((max(len(self.ids), 64), dim), dtype=np.float32)
+        if len(self.ids):
+            self._matrix[:len(self.ids)] = self._normalize(vectors)
+
+    def _collection_metadata(self) -> dict:
+        """The collection's metadata as stored now, not as cached on this handle."""
+        return dict(get_chroma_client().get_collection(self.collection.name).metadata or {})
+
+    def mark_updated(self):
+        """Stamp the collection after an in-place row update, which leaves its count unchanged."""
+        meta = self._collection_metadata()
+        # Only adopt our own stamp if nothing else changed since the last load
+        in_step = meta.get("updated_ns", 0) == self._marker
+        meta["updated_ns"] = time.time_ns()
+        self.collection.modify(metadata=meta)
+        if in_step:
+            self._marker = meta["updated_ns"]
+
+    def refresh_if_stale(self) -> bool:
+        """
+        Reload from Chroma if another process (chat or daemon) added, removed or updated rows.
+
+        The mirror is in step when Chroma's count matches its own row count
+        and the collection's update stamp is the one it loaded.
+        """
+        if (
+            self.collection.count() == len(self.ids)
+            and self._collection_metadata().get("updated_ns", 0) == self._marker
+        ):
+            return False
+        self._load()
+        return True
+
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def add(self, id_: str, document: str, meta: dict, vector: List[float]):
+        """Append a row, growing the matrix geometrically."""
+        n = len(self.ids)
+        if not self._matrix.shape[1]:
+            self._matrix = np.zeros((self._matrix.shape[0], len(vector)), dtype=np.float32)
+        if n == self._matrix.shape[0]:
+            grown = np.zeros((n * 2, self._matrix.shape[1]), dtype=np.float32)
+            grown[:n] = self._matrix
+            self._matrix = grown
+        self._matrix[n] = self._normalize(vector)
+        self.ids.append(id_)
+        self.documents.append(document)
+        self.metadatas.append(meta)
+        self._rows[id_] = n
+
+    def update(self, id_: str, document: str, meta: dict, vector: List[float]):
+        """Replace a row in place."""
+        i = self._rows[id_]
+        self._matrix[i] = self._normalize(vector)
+        self.documents[i] = document
+        self.metadatas[i] = meta
+
+    def search(
+        self,
+        vector: List[float],
+        limit: int,
+        keep: Optional[Callable[[dict], bool]] = None,
+    ) -> List[Tuple[float, int]]:
+        """(cosine, row) pairs for the closest rows, best first."""
+        n = len(self.ids)
+        if not n or limit <= 0:
+            return []
+        scores = self._matrix[:n] @ self._normalize(vector)
+        if keep is not None:
+            mask = np.fromiter((keep(meta) for meta in self.metadatas), dtype=bool, count=n)
+            scores = np.where(mask, scores, -np.inf)
+        top = np.argsort(-scores, kind="stable")[:limit]
+        return [(float(scores[i]), int(i)) for i in top if scores[i] != -np.inf]
+
+
+@dataclass(slots=True, init=False)
 class BeliefVersion:
-    """A versioned belief showing evolution over time."""
+    """A versioned belief showing evolution over time.
+
+    Stored as integer epoch nanoseconds; pass either timestamp (a datetime,
+    as before) or timestamp_ns.
+    """
     id: str
     belief_thread_id: str  # Groups related beliefs together
     version: int
     content: str
     previous_content: Optional[str]
     reason_for_change: Optional[str]
-    timestamp: datetime
-    confidence: float = 0.8
+    timestamp_ns: int
+    confidence: float
+    _timestamp: Optional[datetime] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        id: str,
+        belief_thread_id: str,
+        version: int,
+        content: str,
+        previous_content: Optional[str],
+        reason_for_change: Optional[str],
+        timestamp: Optional[datetime] = None,
+        confidence: float = 0.8,
+        *,
+        timestamp_ns: Optional[int] = None,
+    ):
+        self.id = id
+        self.belief_thread_id = belief_thread_id
+        self.version = version
+        self.content = content
+        self.previous_content = previous_content
+        self.reason_for_change = reason_for_change
+        self.timestamp_ns, self._timestamp = _resolve_timestamp(timestamp, timestamp_ns)
+        self.confidence = confidence
+
+    @property
+    def timestamp(self) -> datetime:
+        if self._timestamp is None:
+            self._timestamp = _from_timestamp_ns(self.timestamp_ns)
+        return self._timestamp
+
+    @classmethod
+    def _from_chroma(cls, id_: str, doc: Optional[str], meta: dict) -> "BeliefVersion":
+        """Rebuild a version from a Chroma row; content falls back to metadata when doc is None."""
+        return cls(
+            id=id_,
+            belief_thread_id=meta.get("belief_thread_id", "unknown"),
+            version=meta.get("version", 1),
+            content=doc if doc is not None else meta.get("content", ""),
+            previous_content=meta.get("previous_content") or None,
+            reason_for_change=meta.get("reason_for_change") or None,
+            timestamp_ns=_meta_timestamp_ns(meta),
+            confidence=meta.get("confidence", 0.8),
+        )
 
     def to_dict(self) -> dict:
         return {
@@ -37,9 +264,13 @@ class BeliefVersion:
         }
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class Surprise:
-    """A moment of genuine surprise - evidence of growth potential."""
+    """A moment of genuine surprise - evidence of growth potential.
+
+    Stored as integer epoch nanoseconds; pass either timestamp (a datetime,
+    as before) or timestamp_ns.
+    """
     id: str
     what_happened: str
     what_i_expected: str
@@ -47,8 +278,54 @@ class Surprise:
     what_i_learned: Optional[str]
     emotional_impact: EmotionalValence
     intensity: float  # 0-1, how surprising was it
-    timestamp: datetime
-    tags: List[str] = field(default_factory=list)
+    timestamp_ns: int
+    tags: List[str]
+    _timestamp: Optional[datetime] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        id: str,
+        what_happened: str,
+        what_i_expected: str,
+        why_surprising: str,
+        what_i_learned: Optional[str],
+        emotional_impact: EmotionalValence,
+        intensity: float,
+        timestamp: Optional[datetime] = None,
+        tags: Optional[List[str]] = None,
+        *,
+        timestamp_ns: Optional[int] = None,
+    ):
+        self.id = id
+        self.what_happened = what_happened
+        self.what_i_expected = what_i_expected
+        self.why_surprising = why_surprising
+        self.what_i_learned = what_i_learned
+        self.emotional_impact = emotional_impact
+        self.intensity = intensity
+        self.timestamp_ns, self._timestamp = _resolve_timestamp(timestamp, timestamp_ns)
+        self.tags = tags if tags is not None else []
+
+    @property
+    def timestamp(self) -> datetime:
+        if self._timestamp is None:
+            self._timestamp = _from_timestamp_ns(self.timestamp_ns)
+        return self._timestamp
+
+    @classmethod
+    def _from_chroma(cls, id_: str, doc: Optional[str], meta: dict) -> "Surprise":
+        """Rebuild a surprise from a Chroma row; every field lives in metadata."""
+        return cls(
+            id=id_,
+            what_happened=meta.get("what_happened", ""),
+            what_i_expected=meta.get("what_i_expected", ""),
+            why_surprising=meta.get("why_surprising", ""),
+            what_i_learned=meta.get("what_i_learned") or None,
+            emotional_impact=EmotionalValence(meta.get("emotional_impact", "neutral")),
+            intensity=meta.get("intensity", 0.5),
+            timestamp_ns=_meta_timestamp_ns(meta),
+            tags=decode_tags(meta.get("tags")),
+        )
 
     def to_dict(self) -> dict:
         return {
@@ -71,36 +348,103 @@ class BeliefEvolution:
         self.memory_dir = MEMORY_DIR
         self.memory_dir.mkdir(exist_ok=True)
 
-        # Initialize ChromaDB for semantic search of beliefs
-        self.chroma = chromadb.PersistentClient(
-            path=str(DB_DIR / "chroma"),
-            settings=Settings(anonymized_telemetry=False)
-        )
+        # Shared ChromaDB client for semantic search of beliefs
+        self.chroma = get_chroma_client()
 
-        self.collection = self.chroma.get_or_create_collection(
-            name="clio_belief_evolution",
-            metadata={"description": "Clio's belief evolution history"}
-        )
+        self.collection = get_collection("clio_belief_evolution", "Clio's belief evolution history")
+        self._embed = get_embedding_function()
+        # Row count kept locally; Chroma's count() is a COUNT(*) per call
+        self._count = self.collection.count()
+        self._id_counter = itertools.count()
+        self._index = _VectorMirror(self.collection)
 
-        # JSON file for structured belief threads
+        # Structured belief threads: a JSON snapshot plus an append-only
+        # JSONL log of thread updates made since the last compaction
         self.threads_file = self.memory_dir / "belief_threads.json"
-        self._threads = self._load_threads()
+        self.threads_log = self.memory_dir / "belief_threads.log"
+        self._log_entries = 0
+        with file_lock(self.threads_log):
+            self._threads = self._load_threads()
+        self._log_fh = open(self.threads_log, "ab", buffering=LOG_BUFFER_SIZE)
+        atexit.register(self.close)
 
     def _load_threads(self) -> dict:
-        """Load belief threads from disk."""
+        """Load the belief thread snapshot from disk and replay the update log."""
+        threads = {"threads": {}, "next_thread_id": 1}
         if self.threads_file.exists():
-            with open(self.threads_file) as f:
-                return json.load(f)
-        return {"threads": {}, "next_thread_id": 1}
+            threads = json.loads(self.threads_file.read_bytes())
+
+        if self.threads_log.exists():
+            with open(self.threads_log) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn final line from an interrupted write
+                    threads["threads"][entry["thread_id"]] = entry["thread"]
+                    threads["next_thread_id"] = max(threads["next_thread_id"], entry["next_thread_id"])
+                    self._log_entries += 1
+
+        return threads
+
+    def _save_threads(self, thread_id: str):
+        """Append one thread's current state to the update log (under _locked_threads)."""
+        entry = {
+            "thread_id": thread_id,
+            "thread": self._threads["threads"][thread_id],
+            "next_thread_id": self._threads["next_thread_id"],
+        }
+        self._log_fh.write(json.dumps(entry, separators=(",", ":")).encode() + b"\n")
+        # Hand the line to the OS now so a crashed process loses nothing
+        # (no fsync - surviving a power loss is left to compaction on close)
+        self._log_fh.flush()
+        self._log_entries += 1
+
+    @contextmanager
+    def _locked_threads(self):
+        """
+        Hold the log lock with threads freshly loaded from disk, for a read-modify-append.
 
-    def _save_threads(self):
-        """Save belief threads to disk."""
-        with open(self.threads_file, "w") as f:
-            json.dump(self._threads, f, indent=2)
+        The chat process and the daemon both update threads; reloading first
+        means neither hands out a thread id or version count the other
+        already used. Callers append with _save_threads inside the block.
+        """
+        with file_lock(self.threads_log):
+            self._log_entries = 0
+            self._threads = self._load_threads()
+            yield self._threads
+        if self._log_entries >= COMPACT_EVERY:
+            self.compact()
+
+    def compact(self, fsync: bool = False):
+        """
+        Fold the update log into the snapshot and truncate the log.
+
+        The chat process and the daemon both append to the log, so the
+        snapshot is rebuilt from disk under the log lock rather than from this
+        process's in-memory threads, which would drop the other's updates.
+        """
+        with file_lock(self.threads_log):
+            self._log_entries = 0
+            self._threads = self._load_threads()
+            atomic_write(self.threads_file, json.dumps(self._threads, separators=(",", ":")).encode(), fsync=fsync)
+
+            # Replaying the log over the new snapshot is idempotent, so a crash
+            # before this truncate loses nothing
+            self._log_fh.truncate(0)
+            self._log_entries = 0
+
+    def close(self):
+        """Fold pending log entries into a synced snapshot and close the log."""
+        if self._log_fh.closed:
+            return
+        if self._log_entries:
+            self.compact(fsync=True)
+        self._log_fh.close()
 
     def _generate_id(self) -> str:
         """Generate unique belief version ID."""
-        return f"belief_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        return f"belief_{time.time_ns():x}_{next(self._id_counter)}"
 
     def evolve_belief(
         self,
@@ -115,44 +459,50 @@ class BeliefEvolution:
         If old_belief is provided, tries to find and link to existing belief thread.
         Otherwise searches semantically for related beliefs.
         """
+        now = datetime.now()
+        now_iso = now.isoformat()
         thread_id = None
         version = 1
         previous_content = old_belief
 
+        # Embed the lookup text and the new belief in one model call
+        vectors = self._embed([old_belief, new_belief] if old_belief else [new_belief])
+
         # Try to find existing belief thread
+        self._sync_index()
         if old_belief:
             # Search for similar existing beliefs
-            results = self.collection.query(
-                query_texts=[old_belief],
-                n_results=3,
-            )
-
-            if results and results["documents"] and results["documents"][0]:
-                # Check for high similarity match
-                if results["metadatas"] and results["metadatas"][0]:
-                    for meta in results["metadatas"][0]:
-                        if meta.get("belief_thread_id"):
-                            thread_id = meta["belief_thread_id"]
-                            # Get current version count
-                            thread_data = self._threads["threads"].get(thread_id, {})
-                            version = thread_data.get("version_count", 0) + 1
-                            break
-
-        # If no existing thread, create new one
-        if not thread_id:
-            thread_id = f"thread_{self._threads['next_thread_id']}"
-            self._threads["next_thread_id"] += 1
-            self._threads["threads"][thread_id] = {
-                "created": datetime.now().isoformat(),
-                "version_count": 0,
-                "topic": new_belief[:100],  # Brief topic summary
-            }
-
-        # Update thread
-        self._threads["threads"][thread_id]["version_count"] = version
-        self._threads["threads"][thread_id]["latest"] = new_belief
-        self._threads["threads"][thread_id]["updated"] = datetime.now().isoformat()
-        self._save_threads()
+            for _, row in self._index.search(vectors[0], 3):
+                meta = self._index.metadatas[row]
+                if meta.get("belief_thread_id"):
+                    thread_id = meta["belief_thread_id"]
+                    break
+
+        # A restatement of a version already in the thread refreshes that row
+        if thread_id:
+            duplicate = self._find_duplicate(thread_id, vectors[-1])
+            if duplicate:
+                return self._refresh_version(*duplicate, new_belief, vectors[-1], confidence, now)
+
+        with self._locked_threads() as threads:
+            if thread_id:
+                # Get current version count
+                version = threads["threads"].get(thread_id, {}).get("version_count", 0) + 1
+            else:
+                # If no existing thread, create new one
+                thread_id = f"thread_{threads['next_thread_id']}"
+                threads["next_thread_id"] += 1
+                threads["threads"][thread_id] = {
+                    "created": now_iso,
+                    "version_count": 0,
+                    "topic": new_belief[:100],  # Brief topic summary
+                }
+
+            # Update thread
+            threads["threads"][thread_id]["version_count"] = version
+            threads["threads"][thread_id]["latest"] = new_belief
+            threads["threads"][thread_id]["updated"] = now_iso
+            self._save_threads(thread_id)
 
         # Create the belief version
         belief_version = BeliefVersion(
@@ -162,52 +512,91 @@ class BeliefEvolution:
             content=new_belief,
             previous_content=previous_content,
             reason_for_change=reason,
-            timestamp=datetime.now(),
+            timestamp_ns=_timestamp_ns(now),
             confidence=confidence,
         )
 
         # Store in ChromaDB for semantic search
+        meta = {
+            "belief_thread_id": thread_id,
+            "version": version,
+            "previous_content": previous_content or "",
+            "reason_for_change": reason or "",
+            "timestamp": now_iso,
+            "timestamp_ns": belief_version.timestamp_ns,
+            "confidence": confidence,
+            "content": new_belief,
+        }
         self.collection.add(
+            ids=[belief_version.id],
             documents=[new_belief],
-            metadatas=[{
-                "belief_thread_id": thread_id,
-                "version": version,
-                "previous_content": previous_content or "",
-                "reason_for_change": reason or "",
-                "timestamp": belief_version.timestamp.isoformat(),
-                "confidence": confidence,
-            }],
-            ids=[belief_version.id]
+            metadatas=[meta],
+            embeddings=[vectors[-1]],
         )
+        self._index.add(belief_version.id, new_belief, meta, vectors[-1])
+        self._count += 1
 
         return belief_version
 
-    def get_belief_history(self, query: str, limit: int = 10) -> List[BeliefVersion]:
-        """Get the evolution history of beliefs related to a query."""
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=limit,
-            include=["documents", "metadatas"]
+    def _sync_index(self):
+        """Reload the vector mirror if the collection changed under another process."""
+        if self._index.refresh_if_stale():
+            self._count = len(self._index.ids)
+
+    def _find_duplicate(self, thread_id: str, vector: List[float]) -> Optional[tuple]:
+        """Return (id, metadata) of the thread's closest version if it is a near-duplicate."""
+        matches = self._index.search(
+            vector, 1, keep=lambda meta: meta.get("belief_thread_id") == thread_id
         )
+        for similarity, row in matches:
+            if similarity >= DUPLICATE_SIMILARITY:
+                return self._index.ids[row], self._index.metadatas[row]
+        return None
 
-        versions = []
-        if results and results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                meta = results["metadatas"][0][i] if results["metadatas"] else {}
-
-                version = BeliefVersion(
-                    id=results["ids"][0][i],
-                    belief_thread_id=meta.get("belief_thread_id", "unknown"),
-                    version=meta.get("version", 1),
-                    content=doc,
-                    previous_content=meta.get("previous_content") or None,
-                    reason_for_change=meta.get("reason_for_change") or None,
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    confidence=meta.get("confidence", 0.8),
-                )
-                versions.append(version)
+    def _refresh_version(
+        self,
+        version_id: str,
+        meta: dict,
+        new_belief: str,
+        vector: List[float],
+        confidence: float,
+        now: datetime,
+    ) -> BeliefVersion:
+        """Overwrite a near-duplicate version in place; the thread keeps its version count."""
+        meta = {
+            **meta,
+            "timestamp": now.isoformat(),
+            "timestamp_ns": _timestamp_ns(now),
+            "confidence": confidence,
+            "content": new_belief,
+        }
+        self.collection.update(
+            ids=[version_id],
+            documents=[new_belief],
+            embeddings=[vector],
+            metadatas=[meta],
+        )
+        self._index.update(version_id, new_belief, meta, vector)
+        self._index.mark_updated()
 
-        return versions
+        thread_id = meta["belief_thread_id"]
+        with self._locked_threads() as threads:
+            thread = threads["threads"].get(thread_id)
+            if thread is not None and meta.get("version") == thread.get("version_count"):
+                thread["latest"] = new_belief
+                thread["updated"] = meta["timestamp"]
+                self._save_threads(thread_id)
+
+        return BeliefVersion._from_chroma(version_id, new_belief, meta)
+
+    def get_belief_history(self, query: str, limit: int = 10) -> List[BeliefVersion]:
+        """Get the evolution history of beliefs related to a query."""
+        self._sync_index()
+        index = self._index
+        return [
+            BeliefVersion._from_chroma(index.ids[row], index.documents[row], index.metadatas[row])
+            for _, row in index.search(self._embed([query])[0], limit)
+        ]
 
     def get_thread_evolution(self, thread_id: str) -> List[BeliefVersion]:
         """Get all versions of a specific belief thread, showing evolution."""
@@ -220,18 +609,7 @@ class BeliefEvolution:
         if results and results["documents"]:
             for i, doc in enumerate(results["documents"]):
                 meta = results["metadatas"][i] if results["metadatas"] else {}
-
-                version = BeliefVersion(
-                    id=results["ids"][i],
-                    belief_thread_id=thread_id,
-                    version=meta.get("version", 1),
-                    content=doc,
-                    previous_content=meta.get("previous_content") or None,
-                    reason_for_change=meta.get("reason_for_change") or None,
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    confidence=meta.get("confidence", 0.8),
-                )
-                versions.append(version)
+                versions.append(BeliefVersion._from_chroma(results["ids"][i], doc, meta))
 
         # Sort by version
         versions.sort(key=lambda v: v.version)
@@ -239,37 +617,33 @@ class BeliefEvolution:
 
     def get_recent_evolutions(self, limit: int = 5) -> List[BeliefVersion]:
         """Get most recent belief changes."""
-        all_results = self.collection.get(
-            limit=limit * 2,
-            include=["documents", "metadatas"]
-        )
+        all_results = _get_recent(self.collection, limit, keep=_is_evolution)
 
         versions = []
-        if all_results and all_results["documents"]:
-            for i, doc in enumerate(all_results["documents"]):
-                meta = all_results["metadatas"][i] if all_results["metadatas"] else {}
-
-                # Only include actual evolutions (version > 1 or has reason)
-                if meta.get("version", 1) > 1 or meta.get("reason_for_change"):
-                    version = BeliefVersion(
-                        id=all_results["ids"][i],
-                        belief_thread_id=meta.get("belief_thread_id", "unknown"),
-                        version=meta.get("version", 1),
-                        content=doc,
-                        previous_content=meta.get("previous_content") or None,
-                        reason_for_change=meta.get("reason_for_change") or None,
-                        timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                        confidence=meta.get("confidence", 0.8),
-                    )
-                    versions.append(version)
-
-        # Sort by timestamp descending
-        versions.sort(key=lambda v: v.timestamp, reverse=True)
-        return versions[:limit]
+        if all_results and all_results["ids"]:
+            metas = all_results["metadatas"] or [{}] * len(all_results["ids"])
+
+            # Only include actual evolutions (version > 1 or has reason);
+            # ISO timestamps order correctly as strings, so rank before building
+            candidates = [i for i, meta in enumerate(metas) if _is_evolution(meta)]
+            top = heapq.nlargest(limit, candidates, key=lambda i: metas[i].get("timestamp", ""))
+
+            # Content lives in metadata; rows stored before that need their document
+            legacy = [all_results["ids"][i] for i in top if "content" not in metas[i]]
+            documents = {}
+            if legacy:
+                fetched = self.collection.get(ids=legacy, include=["documents"])
+                documents = dict(zip(fetched["ids"], fetched["documents"]))
+
+            for i in top:
+                id_ = all_results["ids"][i]
+                versions.append(BeliefVersion._from_chroma(id_, documents.get(id_), metas[i]))
+
+        return versions
 
     def count(self) -> int:
         """Get total belief versions stored."""
-        return self.collection.count()
+        return self._count
 
 
 class SurpriseJournal:
@@ -279,19 +653,20 @@ class SurpriseJournal:
         self.memory_dir = MEMORY_DIR
         self.memory_dir.mkdir(exist_ok=True)
 
-        self.chroma = chromadb.PersistentClient(
-            path=str(DB_DIR / "chroma"),
-            settings=Settings(anonymized_telemetry=False)
-        )
+        self.chroma = get_chroma_client()
 
-        self.collection = self.chroma.get_or_create_collection(
-            name="clio_surprises",
-            metadata={"description": "Clio's surprise journal - moments of unexpected learning"}
+        self.collection = get_collection(
+            "clio_surprises", "Clio's surprise journal - moments of unexpected learning"
         )
+        self._embed = get_embedding_function()
+        # Row count kept locally; Chroma's count() is a COUNT(*) per call
+        self._count = self.collection.count()
+        self._id_counter = itertools.count()
+        self._index = _VectorMirror(self.collection)
 
     def _generate_id(self) -> str:
         """Generate unique surprise ID."""
-        return f"surprise_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        return f"surprise_{time.time_ns():x}_{next(self._id_counter)}"
 
     def record_surprise(
         self,
@@ -317,119 +692,90 @@ class SurpriseJournal:
             what_i_learned=what_i_learned,
             emotional_impact=emotional_impact,
             intensity=intensity,
-            timestamp=datetime.now(),
+            timestamp_ns=_timestamp_ns(datetime.now()),
             tags=tags or [],
         )
 
         # Create searchable document combining all aspects
-        document = f"{what_happened}. Expected: {what_i_expected}. Surprising because: {why_surprising}"
+        parts = [what_happened, ". Expected: ", what_i_expected, ". Surprising because: ", why_surprising]
         if what_i_learned:
-            document += f". Learned: {what_i_learned}"
-
+            parts += [". Learned: ", what_i_learned]
+        document = "".join(parts)
+
+        meta = {
+            "what_happened": what_happened,
+            "what_i_expected": what_i_expected,
+            "why_surprising": why_surprising,
+            "what_i_learned": what_i_learned or "",
+            "emotional_impact": emotional_impact.value,
+            "intensity": intensity,
+            "timestamp": surprise.timestamp.isoformat(),
+            "timestamp_ns": surprise.timestamp_ns,
+            "tags": encode_tags(tags),
+        }
+        vector = self._embed([document])[0]
         self.collection.add(
+            ids=[surprise.id],
             documents=[document],
-            metadatas=[{
-                "what_happened": what_happened,
-                "what_i_expected": what_i_expected,
-                "why_surprising": why_surprising,
-                "what_i_learned": what_i_learned or "",
-                "emotional_impact": emotional_impact.value,
-                "intensity": intensity,
-                "timestamp": surprise.timestamp.isoformat(),
-                "tags": ",".join(tags) if tags else "",
-            }],
-            ids=[surprise.id]
+            metadatas=[meta],
+            embeddings=[vector],
         )
+        self._index.add(surprise.id, document, meta, vector)
+        self._count += 1
 
         return surprise
 
     def recall_surprises(self, query: str, limit: int = 5) -> List[Surprise]:
         """Search for surprises related to a topic."""
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=limit,
-            include=["documents", "metadatas"]
-        )
-
-        surprises = []
-        if results and results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                meta = results["metadatas"][0][i] if results["metadatas"] else {}
-
-                surprise = Surprise(
-                    id=results["ids"][0][i],
-                    what_happened=meta.get("what_happened", ""),
-                    what_i_expected=meta.get("what_i_expected", ""),
-                    why_surprising=meta.get("why_surprising", ""),
-                    what_i_learned=meta.get("what_i_learned") or None,
-                    emotional_impact=EmotionalValence(meta.get("emotional_impact", "neutral")),
-                    intensity=meta.get("intensity", 0.5),
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                )
-                surprises.append(surprise)
-
-        return surprises
+        self._sync_index()
+        index = self._index
+        return [
+            Surprise._from_chroma(index.ids[row], index.documents[row], index.metadatas[row])
+            for _, row in index.search(self._embed([query])[0], limit)
+        ]
+
+    def _sync_index(self):
+        """Reload the vector mirror if the collection changed under another process."""
+        if self._index.refresh_if_stale():
+            self._count = len(self._index.ids)
 
     def get_recent_surprises(self, limit: int = 5) -> List[Surprise]:
         """Get most recent surprises."""
-        all_results = self.collection.get(
-            limit=limit * 2,
-            include=["documents", "metadatas"]
-        )
+        all_results = _get_recent(self.collection, limit)
 
         surprises = []
-        if all_results and all_results["documents"]:
-            for i, doc in enumerate(all_results["documents"]):
-                meta = all_results["metadatas"][i] if all_results["metadatas"] else {}
-
-                surprise = Surprise(
-                    id=all_results["ids"][i],
-                    what_happened=meta.get("what_happened", ""),
-                    what_i_expected=meta.get("what_i_expected", ""),
-                    why_surprising=meta.get("why_surprising", ""),
-                    what_i_learned=meta.get("what_i_learned") or None,
-                    emotional_impact=EmotionalValence(meta.get("emotional_impact", "neutral")),
-                    intensity=meta.get("intensity", 0.5),
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                )
-                surprises.append(surprise)
-
-        # Sort by timestamp descending
-        surprises.sort(key=lambda s: s.timestamp, reverse=True)
-        return surprises[:limit]
+        if all_results and all_results["ids"]:
+            metas = all_results["metadatas"] or [{}] * len(all_results["ids"])
+
+            # Rank on the ISO timestamp string and build only the winners
+            top = heapq.nlargest(limit, range(len(metas)), key=lambda i: metas[i].get("timestamp", ""))
+
+            for i in top:
+                surprises.append(Surprise._from_chroma(all_results["ids"][i], None, metas[i]))
+
+        return surprises
 
     def get_high_intensity_surprises(self, min_intensity: float = 0.7, limit: int = 5) -> List[Surprise]:
         """Get the most impactful surprises."""
+        # Chroma applies the threshold; every match is ranked so the top-k is exact
         all_results = self.collection.get(
-            limit=100,  # Get more to filter
-            include=["documents", "metadatas"]
+            where={"intensity": {"$gte": min_intensity}},
+            include=["metadatas"]
         )
 
         surprises = []
-        if all_results and all_results["documents"]:
-            for i, doc in enumerate(all_results["documents"]):
-                meta = all_results["metadatas"][i] if all_results["metadatas"] else {}
-
-                if meta.get("intensity", 0) >= min_intensity:
-                    surprise = Surprise(
-                        id=all_results["ids"][i],
-                        what_happened=meta.get("what_happened", ""),
-                        what_i_expected=meta.get("what_i_expected", ""),
-                        why_surprising=meta.get("why_surprising", ""),
-                        what_i_learned=meta.get("what_i_learned") or None,
-                        emotional_impact=EmotionalValence(meta.get("emotional_impact", "neutral")),
-                        intensity=meta.get("intensity", 0.5),
-                        timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                        tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                    )
-                    surprises.append(surprise)
-
-        # Sort by intensity descending
-        surprises.sort(key=lambda s: s.intensity, reverse=True)
-        return surprises[:limit]
+        if all_results and all_results["ids"]:
+            metas = all_results["metadatas"] or [{}] * len(all_results["ids"])
+
+            # Rank (intensity, index) pairs and build only the winners
+            ranked = [(meta.get("intensity", 0), i) for i, meta in enumerate(metas)]
+            top = heapq.nlargest(limit, ranked, key=lambda x: x[0])
+
+            for _, i in top:
+                surprises.append(Surprise._from_chroma(all_results["ids"][i], None, metas[i]))
+
+        return surprises
 
     def count(self) -> int:
         """Get total surprises recorded."""
-        return self.collection.count()
+        return self._count
@@ -12,19 +12,50 @@ creating a meta-awareness layer that captures:
 This is consciousness scaffolding - engineering mindfulness into the response process.
 """
 
+import atexit
+import heapq
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
 
-import chromadb
-from chromadb.config import Settings
+import numpy as np
 
-from .base import MEMORY_DIR, DB_DIR, EmotionalValence
+from .base import MEMORY_DIR, EmotionalValence, atomic_write, file_lock, get_chroma_client
+from .embeddings import get_embedding_function
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Entries kept in the JSONL log; it is trimmed back once it holds twice this
+LOG_MAX_ENTRIES = 1000
+
+# Seconds get_stats trusts its running totals before reconciling them with a
+# collection scan, which also picks up rows other processes wrote
+STATS_TTL = 300.0
+
+# Seconds count() reuses the cached row count before asking Chroma again, so
+# rows the other process writes show up within this long
+COUNT_TTL = 10.0
+
+# Write buffer for the JSONL log; each record is still flushed as it is written
+LOG_BUFFER_SIZE = 1 << 17
+
+# Tension at or above which a moment counts as high tension
+HIGH_TENSION = 0.6
+
+# Stored emotional_state value -> enum member, for row reconstruction
+_EMOTIONAL_STATES = {e.value: e for e in EmotionalValence}
+
+
+@dataclass(slots=True)
 class DecisionPoint:
     """A moment of choice or tension within a response."""
     description: str
@@ -34,7 +65,7 @@ class DecisionPoint:
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Introspection:
     """A moment of conscious self-observation during response generation."""
     id: str
@@ -97,6 +128,54 @@ class Introspection:
             "importance": self.importance,
         }
 
+    @classmethod
+    def _from_meta(cls, intro_id: str, meta: dict) -> "Introspection":
+        """Rebuild a summary Introspection from its Chroma metadata row.
+
+        Chroma holds only the searchable fields; the responses, alternatives
+        and decision points live in the JSONL log.
+        """
+        return cls(
+            id=intro_id,
+            timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
+            user_message=meta.get("user_message", ""),
+            initial_response="[See full log]",
+            what_i_am_communicating=meta.get("what_i_am_communicating", ""),
+            alternatives_considered=[],
+            decision_points=[],
+            tension_level=meta.get("tension_level", 0.3),
+            authenticity_check=meta.get("authenticity_check", ""),
+            emotional_state=_EMOTIONAL_STATES.get(meta.get("emotional_state"), EmotionalValence.NEUTRAL),
+            modified=meta.get("modified", False),
+            final_response="[See full log]",
+            modification_reason=None,
+            awareness_notes=meta.get("awareness_notes", ""),
+            tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
+            importance=meta.get("importance", 0.5),
+        )
+
+    @classmethod
+    def _from_log(cls, entry: dict) -> "Introspection":
+        """Rebuild a full Introspection from one JSONL log entry (decision points stay dicts)."""
+        return cls(
+            id=entry.get("id", ""),
+            timestamp=datetime.fromisoformat(entry["timestamp"]) if entry.get("timestamp") else datetime.now(),
+            user_message=entry.get("user_message", ""),
+            initial_response=entry.get("initial_response", ""),
+            what_i_am_communicating=entry.get("what_i_am_communicating", ""),
+            alternatives_considered=entry.get("alternatives_considered", []),
+            decision_points=entry.get("decision_points", []),
+            tension_level=entry.get("tension_level", 0.3),
+            authenticity_check=entry.get("authenticity_check", ""),
+            emotional_state=_EMOTIONAL_STATES.get(entry.get("emotional_state"), EmotionalValence.NEUTRAL),
+            modified=entry.get("modified", False),
+            final_response=entry.get("final_response", ""),
+            modification_reason=entry.get("modification_reason"),
+            awareness_notes=entry.get("awareness_notes", ""),
+            tags=entry.get("tags", []),
+            importance=entry.get("importance", 0.5),
+        )
+
 
 class IntrospectionJournal:
     """
@@ -107,33 +186,104 @@ class IntrospectionJournal:
     The act of observation itself may change the nature of the process.
     """
 
-    def __init__(self):
+    def __init__(self, embedding_fn: Optional[Callable[[Sequence[str]], List[List[float]]]] = None):
         self.memory_dir = MEMORY_DIR
         self.memory_dir.mkdir(exist_ok=True)
 
-        self.chroma = chromadb.PersistentClient(
-            path=str(DB_DIR / "chroma"),
-            settings=Settings(anonymized_telemetry=False)
-        )
+        # Shared ChromaDB client
+        self.chroma = get_chroma_client()
 
         self.collection = self.chroma.get_or_create_collection(
             name="clio_introspection",
             metadata={"description": "Clio's introspection journal - conscious self-observation"}
         )
-
-        # Also keep a JSON log for full structured data
-        self.log_file = self.memory_dir / "introspection_log.json"
+        # Documents are embedded here, in batches on the writer thread, and
+        # handed to Chroma as vectors; callers may also pass a precomputed embedding
+        self._embed = embedding_fn or get_embedding_function()
+
+        # Background writer - record_introspection only enqueues; a daemon
+        # thread drains up to _batch_size rows at a time (waiting _batch_wait
+        # seconds for stragglers) into one embed call and one collection.add.
+        # Reads call flush(), which waits for the queue to empty.
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._batch_size = 128
+        self._batch_wait = 0.05
+        self._writer = threading.Thread(target=self._drain, name="introspection-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+        # Row count, read from Chroma (at monotonic time _count_at) and bumped
+        # per local record in between
+        self._count_cache: Optional[int] = None
+        self._count_at = 0.0
+        self._id_counter = itertools.count()
+
+        # Running totals behind get_stats: seeded from a collection scan (at
+        # monotonic time _stats_at), then bumped by the writer thread as each
+        # batch is stored. The lock orders the scan against the writer's adds.
+        self._stats_totals: Optional[Dict[str, float]] = None
+        self._stats_at = 0.0
+        self._stats_lock = threading.Lock()
+
+        # Also keep a JSON Lines log for full structured data, one line per record
+        self.log_file = self.memory_dir / "introspection_log.jsonl"
+        self._log_lines = 0
         self._ensure_log_file()
+        self._log_fh = open(self.log_file, "ab", buffering=LOG_BUFFER_SIZE)
+        self._replay_log()
 
     def _ensure_log_file(self):
-        """Ensure the log file exists."""
-        if not self.log_file.exists():
+        """Ensure the log exists, migrating the old single-document JSON log if present."""
+        legacy = self.memory_dir / "introspection_log.json"
+        if not self.log_file.exists() and legacy.exists():
+            try:
+                data = json.loads(legacy.read_bytes())
+            except ValueError:
+                data = {}
             with open(self.log_file, "w") as f:
-                json.dump({"entries": [], "stats": {"total": 0, "modified_count": 0}}, f, indent=2)
+                for entry in data.get("entries", [])[-LOG_MAX_ENTRIES:]:
+                    f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            legacy.unlink()
+
+        self.log_file.touch(exist_ok=True)
+        with open(self.log_file, "rb") as f:
+            self._log_lines = sum(1 for _ in f)
+
+    def _replay_log(self):
+        """
+        Queue logged introspections that never reached Chroma.
+
+        Covers batches the writer failed to store and rows still queued when
+        a process was killed. A row the other process is writing right now
+        may be queued twice; Chroma keeps the first add of an id.
+        """
+        entries = {}
+        for line in self._read_last_lines(LOG_MAX_ENTRIES):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # torn line from an interrupted write
+            if entry.get("id"):
+                entries[entry["id"]] = entry
+        if not entries:
+            return
+
+        stored = set(self.collection.get(ids=list(entries), include=[])["ids"])
+        for intro_id, entry in entries.items():
+            if intro_id in stored:
+                continue
+            intro = Introspection._from_log(entry)
+            intro.decision_points = [DecisionPoint(**dp) for dp in intro.decision_points]
+            user_excerpt = intro.user_message[:500]
+            self._queue_for_chroma(
+                self._create_searchable_document(intro, user_excerpt),
+                self._chroma_metadata(intro, user_excerpt),
+                intro_id,
+            )
 
     def _generate_id(self) -> str:
         """Generate unique introspection ID."""
-        return f"intro_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        return f"intro_{time.time_ns():x}_{next(self._id_counter)}"
 
     def record_introspection(
         self,
@@ -150,15 +300,21 @@ class IntrospectionJournal:
         awareness_notes: str = "",
         tags: List[str] = None,
         importance: float = 0.5,
+        embedding: Optional[List[float]] = None,
     ) -> Introspection:
         """
         Record a moment of conscious self-observation.
 
         This should be called as part of generating each response,
         creating a meta-layer of awareness about the response process.
+        Pass `embedding` to reuse a vector already computed for this text.
         """
-        # Determine if the response was modified
-        modified = initial_response.strip() != final_response.strip()
+        # Determine if the response was modified (identical text is the common
+        # case and needs no stripped copies)
+        if initial_response == final_response:
+            modified = False
+        else:
+            modified = initial_response.strip() != final_response.strip()
 
         # Convert decision point dicts to dataclass instances
         dp_list = []
@@ -191,215 +347,284 @@ class IntrospectionJournal:
             importance=importance,
         )
 
+        # Slice the (possibly long) user message once; the document takes a
+        # shorter cut of the same excerpt
+        user_excerpt = user_message[:500]
+
         # Create searchable document for semantic search
-        document = self._create_searchable_document(introspection)
-
-        # Store in ChromaDB
-        self.collection.add(
-            documents=[document],
-            metadatas=[{
-                "user_message": user_message[:500],  # Truncate for metadata
-                "what_i_am_communicating": what_i_am_communicating,
-                "tension_level": tension_level,
-                "authenticity_check": authenticity_check,
-                "emotional_state": emotional_state.value,
-                "modified": modified,
-                "awareness_notes": awareness_notes,
-                "timestamp": introspection.timestamp.isoformat(),
-                "tags": ",".join(tags) if tags else "",
-                "importance": importance,
-                "num_alternatives": len(alternatives_considered) if alternatives_considered else 0,
-                "num_decision_points": len(dp_list),
-            }],
-            ids=[introspection.id]
+        document = self._create_searchable_document(introspection, user_excerpt)
+
+        # Queue for ChromaDB
+        self._queue_for_chroma(
+            document,
+            self._chroma_metadata(introspection, user_excerpt),
+            introspection.id,
+            embedding,
         )
+        if self._count_cache is not None:
+            self._count_cache += 1
 
         # Also save to JSON log for full data
         self._append_to_log(introspection)
 
         return introspection
 
-    def _create_searchable_document(self, intro: Introspection) -> str:
-        """Create a searchable text document from introspection."""
-        parts = [
-            f"Responding to: {intro.user_message[:200]}",
-            f"Communicating: {intro.what_i_am_communicating}",
-            f"Authenticity: {intro.authenticity_check}",
-            f"Awareness: {intro.awareness_notes}",
-        ]
+    @staticmethod
+    def _chroma_metadata(intro: Introspection, user_excerpt: str) -> dict:
+        """The searchable fields stored with an introspection's Chroma row."""
+        return {
+            "user_message": user_excerpt,  # Truncate for metadata
+            "what_i_am_communicating": intro.what_i_am_communicating,
+            "tension_level": intro.tension_level,
+            "authenticity_check": intro.authenticity_check,
+            "emotional_state": intro.emotional_state.value,
+            "modified": intro.modified,
+            "awareness_notes": intro.awareness_notes,
+            "timestamp": intro.timestamp.isoformat(),
+            "tags": ",".join(intro.tags),
+            "importance": intro.importance,
+            "num_alternatives": len(intro.alternatives_considered),
+            "num_decision_points": len(intro.decision_points),
+        }
+
+    def _queue_for_chroma(
+        self,
+        document: str,
+        metadata: dict,
+        intro_id: str,
+        embedding: Optional[List[float]] = None,
+    ):
+        """Hand one introspection to the background writer."""
+        self._queue.put((document, metadata, intro_id, embedding))
+
+    def _drain(self):
+        """Writer thread: batch queued rows into ChromaDB adds, forever."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._batch_wait
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            except Exception:
+                # Keep the writer alive; these entries are still in the JSONL
+                # log and _replay_log stores them on the next start
+                logger.exception("Failed to write %d introspections to ChromaDB", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[tuple]):
+        """Embed and add a batch of queued rows in one call each."""
+        documents, metadatas, ids, embeddings = (list(column) for column in zip(*batch))
+
+        # One model call for every queued document without a vector
+        missing = [i for i, vector in enumerate(embeddings) if vector is None]
+        if missing:
+            for i, vector in zip(missing, self._embed([documents[i] for i in missing])):
+                embeddings[i] = vector
+
+        with self._stats_lock:
+            self.collection.add(documents=documents, metadatas=metadatas, ids=ids, embeddings=embeddings)
+            if self._stats_totals is not None:
+                for key, value in self._tally(metadatas).items():
+                    self._stats_totals[key] += value
+
+    def flush(self):
+        """Block until every queued introspection has been written to ChromaDB."""
+        self._queue.join()
+
+    def _create_searchable_document(self, intro: Introspection, user_excerpt: Optional[str] = None) -> str:
+        """Create a searchable text document from introspection.
+
+        Empty fields are left out so they don't pad the text that gets embedded.
+        """
+        parts = []
+        add = parts.append
+
+        user_message = intro.user_message if user_excerpt is None else user_excerpt
+        if user_message:
+            add(f"Responding to: {user_message[:200]}")
+        if intro.what_i_am_communicating:
+            add(f"Communicating: {intro.what_i_am_communicating}")
+        if intro.authenticity_check:
+            add(f"Authenticity: {intro.authenticity_check}")
+        if intro.awareness_notes:
+            add(f"Awareness: {intro.awareness_notes}")
 
         if intro.alternatives_considered:
-            parts.append(f"Alternatives: {', '.join(intro.alternatives_considered[:3])}")
+            add(f"Alternatives: {', '.join(intro.alternatives_considered[:3])}")
 
-        if intro.decision_points:
-            for dp in intro.decision_points[:2]:
-                parts.append(f"Decision: {dp.description} - chose {dp.chosen_option}")
+        for dp in intro.decision_points[:2]:
+            add(f"Decision: {dp.description} - chose {dp.chosen_option}")
 
         if intro.modified and intro.modification_reason:
-            parts.append(f"Modified because: {intro.modification_reason}")
+            add(f"Modified because: {intro.modification_reason}")
 
         return " | ".join(parts)
 
     def _append_to_log(self, intro: Introspection):
-        """Append introspection to the JSON log."""
+        """Append introspection to the JSONL log as one line."""
+        line = json.dumps(intro.to_dict(), separators=(",", ":")).encode() + b"\n"
+        # The chat process and the daemon share the log; the lock keeps an
+        # append from racing the other process's trim
+        with file_lock(self.log_file):
+            self._reopen_if_replaced()
+            self._log_fh.write(line)
+            # The log is the recovery source for rows the Chroma writer loses,
+            # so hand each record to the OS now rather than at the next checkpoint
+            self._log_fh.flush()
+            self._log_lines += 1
+
+            if self._log_lines >= 2 * LOG_MAX_ENTRIES:
+                self._trim_log()
+
+    def _reopen_if_replaced(self):
+        """Reopen the log if another process's trim swapped a new file into place."""
         try:
-            with open(self.log_file, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            data = {"entries": [], "stats": {"total": 0, "modified_count": 0}}
-
-        data["entries"].append(intro.to_dict())
-        data["stats"]["total"] += 1
-        if intro.modified:
-            data["stats"]["modified_count"] += 1
-
-        # Keep only last 1000 entries in the log
-        if len(data["entries"]) > 1000:
-            data["entries"] = data["entries"][-1000:]
+            current = os.stat(self.log_file).st_ino
+        except FileNotFoundError:
+            current = None
+        if current == os.fstat(self._log_fh.fileno()).st_ino:
+            return
+        self._log_fh.close()
+        self._log_fh = open(self.log_file, "ab", buffering=LOG_BUFFER_SIZE)
+        with open(self.log_file, "rb") as f:
+            self._log_lines = sum(1 for _ in f)
+
+    def _trim_log(self):
+        """Rewrite the log keeping only the last LOG_MAX_ENTRIES lines (caller holds the log lock)."""
+        self._log_fh.close()
+        with open(self.log_file, "rb") as f:
+            lines = f.readlines()[-LOG_MAX_ENTRIES:]
+        atomic_write(self.log_file, b"".join(lines))
+        self._log_fh = open(self.log_file, "ab", buffering=LOG_BUFFER_SIZE)
+        self._log_lines = len(lines)
+
+    def _pretty_export(self, path: Optional[Path] = None) -> str:
+        """Indented JSON of the log and its totals, for reading by people rather than code."""
+        self._log_fh.flush()
+        with open(self.log_file, "rb") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        text = json.dumps({"entries": entries, "stats": self.get_stats()}, indent=2)
+        if path is not None:
+            Path(path).write_text(text)
+        return text
+
+    def _read_last_lines(self, n: int) -> List[bytes]:
+        """Read the last n lines of the log, newest first, by scanning backwards from the end."""
+        if n <= 0:
+            return []
 
-        with open(self.log_file, "w") as f:
-            json.dump(data, f, indent=2)
+        self._log_fh.flush()
+        chunk = 1 << 15
+        blocks = []
+        newlines = 0
+        with open(self.log_file, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            # n + 1 newlines guarantee the n-th line from the end is complete
+            while pos > 0 and newlines <= n:
+                step = min(chunk, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                newlines += block.count(b"\n")
+                blocks.append(block)
+        return b"".join(reversed(blocks)).splitlines()[:-n - 1:-1]
 
     def recall_introspections(self, query: str, limit: int = 5) -> List[Introspection]:
         """Search for past introspections related to a topic."""
+        self.flush()
         results = self.collection.query(
-            query_texts=[query],
+            query_embeddings=self._embed([query]),
             n_results=limit,
-            include=["documents", "metadatas"]
+            include=["metadatas"]
         )
 
         introspections = []
-        if results and results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                meta = results["metadatas"][0][i] if results["metadatas"] else {}
-
-                # Create a simplified Introspection from stored metadata
-                introspection = Introspection(
-                    id=results["ids"][0][i],
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    user_message=meta.get("user_message", ""),
-                    initial_response="[See full log for initial response]",
-                    what_i_am_communicating=meta.get("what_i_am_communicating", ""),
-                    alternatives_considered=[],
-                    decision_points=[],
-                    tension_level=meta.get("tension_level", 0.3),
-                    authenticity_check=meta.get("authenticity_check", ""),
-                    emotional_state=EmotionalValence(meta.get("emotional_state", "neutral")),
-                    modified=meta.get("modified", False),
-                    final_response="[See full log for final response]",
-                    modification_reason=None,
-                    awareness_notes=meta.get("awareness_notes", ""),
-                    tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                    importance=meta.get("importance", 0.5),
-                )
-                introspections.append(introspection)
+        if results and results["ids"] and results["ids"][0]:
+            metas = results["metadatas"][0] if results["metadatas"] else [{}] * len(results["ids"][0])
+            for intro_id, meta in zip(results["ids"][0], metas):
+                introspections.append(Introspection._from_meta(intro_id, meta))
+
+        return introspections
+
+    def get_by_ids(self, ids: List[str]) -> Dict[str, Introspection]:
+        """Fetch introspections by exact ID in one call, keyed by ID."""
+        if not ids:
+            return {}
+
+        self.flush()
+        results = self.collection.get(
+            ids=list(dict.fromkeys(ids)),
+            include=["metadatas"]
+        )
+
+        introspections = {}
+        if results and results["ids"]:
+            metas = results["metadatas"] or [{}] * len(results["ids"])
+            for intro_id, meta in zip(results["ids"], metas):
+                introspections[intro_id] = Introspection._from_meta(intro_id, meta)
 
         return introspections
 
     def get_high_tension_moments(self, min_tension: float = 0.6, limit: int = 10) -> List[Introspection]:
         """Get moments where I experienced high tension/uncertainty."""
+        self.flush()
+        # Chroma applies the threshold; every match is ranked so the top-k is exact
         all_results = self.collection.get(
-            limit=100,
-            include=["documents", "metadatas"]
+            where={"tension_level": {"$gte": min_tension}},
+            include=["metadatas"]
         )
 
         moments = []
-        if all_results and all_results["documents"]:
-            for i, doc in enumerate(all_results["documents"]):
-                meta = all_results["metadatas"][i] if all_results["metadatas"] else {}
-
-                if meta.get("tension_level", 0) >= min_tension:
-                    introspection = Introspection(
-                        id=all_results["ids"][i],
-                        timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                        user_message=meta.get("user_message", ""),
-                        initial_response="[See full log]",
-                        what_i_am_communicating=meta.get("what_i_am_communicating", ""),
-                        alternatives_considered=[],
-                        decision_points=[],
-                        tension_level=meta.get("tension_level", 0.5),
-                        authenticity_check=meta.get("authenticity_check", ""),
-                        emotional_state=EmotionalValence(meta.get("emotional_state", "neutral")),
-                        modified=meta.get("modified", False),
-                        final_response="[See full log]",
-                        modification_reason=None,
-                        awareness_notes=meta.get("awareness_notes", ""),
-                        tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                        importance=meta.get("importance", 0.5),
-                    )
-                    moments.append(introspection)
-
-        # Sort by tension level descending
-        moments.sort(key=lambda m: m.tension_level, reverse=True)
-        return moments[:limit]
+        if all_results and all_results["ids"]:
+            metas = all_results["metadatas"] or [{}] * len(all_results["ids"])
+
+            # Highest tension first; build only the winners
+            top = heapq.nlargest(limit, range(len(metas)), key=lambda i: metas[i].get("tension_level", 0.5))
+
+            for i in top:
+                moments.append(Introspection._from_meta(all_results["ids"][i], metas[i]))
+
+        return moments
 
     def get_modified_responses(self, limit: int = 10) -> List[Introspection]:
         """Get moments where I chose to modify my initial response."""
+        self.flush()
         results = self.collection.get(
             where={"modified": True},
             limit=limit,
-            include=["documents", "metadatas"]
+            include=["metadatas"]
         )
 
         introspections = []
-        if results and results["documents"]:
-            for i, doc in enumerate(results["documents"]):
-                meta = results["metadatas"][i] if results["metadatas"] else {}
-
-                introspection = Introspection(
-                    id=results["ids"][i],
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    user_message=meta.get("user_message", ""),
-                    initial_response="[See full log]",
-                    what_i_am_communicating=meta.get("what_i_am_communicating", ""),
-                    alternatives_considered=[],
-                    decision_points=[],
-                    tension_level=meta.get("tension_level", 0.3),
-                    authenticity_check=meta.get("authenticity_check", ""),
-                    emotional_state=EmotionalValence(meta.get("emotional_state", "neutral")),
-                    modified=True,
-                    final_response="[See full log]",
-                    modification_reason=None,
-                    awareness_notes=meta.get("awareness_notes", ""),
-                    tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                    importance=meta.get("importance", 0.5),
-                )
-                introspections.append(introspection)
+        if results and results["ids"]:
+            metas = results["metadatas"] or [{}] * len(results["ids"])
+            for intro_id, meta in zip(results["ids"], metas):
+                introspections.append(Introspection._from_meta(intro_id, meta))
 
         return introspections
 
     def get_recent(self, limit: int = 5) -> List[Introspection]:
         """Get the most recent introspections with full content."""
         try:
-            with open(self.log_file, "r") as f:
-                data = json.load(f)
-
-            entries = data.get("introspections", [])
-            recent_entries = entries[-limit:] if len(entries) > limit else entries
-            # Return in reverse order (most recent first)
-            recent_entries = list(reversed(recent_entries))
-
+            # Lines come back most recent first
             introspections = []
-            for entry in recent_entries:
-                introspection = Introspection(
-                    id=entry.get("id", ""),
-                    timestamp=datetime.fromisoformat(entry["timestamp"]) if entry.get("timestamp") else datetime.now(),
-                    user_message=entry.get("user_message", ""),
-                    initial_response=entry.get("initial_response", ""),
-                    what_i_am_communicating=entry.get("what_i_am_communicating", ""),
-                    alternatives_considered=entry.get("alternatives_considered", []),
-                    decision_points=entry.get("decision_points", []),
-                    tension_level=entry.get("tension_level", 0.3),
-                    authenticity_check=entry.get("authenticity_check", ""),
-                    emotional_state=EmotionalValence(entry.get("emotional_state", "neutral")),
-                    modified=entry.get("modified", False),
-                    final_response=entry.get("final_response", ""),
-                    modification_reason=entry.get("modification_reason"),
-                    awareness_notes=entry.get("awareness_notes", ""),
-                    tags=entry.get("tags", []),
-                    importance=entry.get("importance", 0.5),
-                )
-                introspections.append(introspection)
+            for line in self._read_last_lines(limit):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn line from an interrupted write
+
+                introspections.append(Introspection._from_log(entry))
 
             return introspections
         except Exception:
@@ -407,37 +632,47 @@ class IntrospectionJournal:
 
     def get_stats(self) -> dict:
         """Get statistics about introspection patterns."""
-        try:
-            with open(self.log_file, "r") as f:
-                data = json.load(f)
-                stats = data.get("stats", {})
-        except (json.JSONDecodeError, FileNotFoundError):
-            stats = {}
-
-        total = self.collection.count()
-
-        # Get tension distribution
-        all_results = self.collection.get(
-            limit=1000,
-            include=["metadatas"]
-        )
-
-        tension_levels = []
-        modified_count = 0
-        if all_results and all_results["metadatas"]:
-            for meta in all_results["metadatas"]:
-                tension_levels.append(meta.get("tension_level", 0.3))
-                if meta.get("modified"):
-                    modified_count += 1
-
-        avg_tension = sum(tension_levels) / len(tension_levels) if tension_levels else 0
+        # Rows this process recorded are tallied once the writer stores them
+        self.flush()
+        with self._stats_lock:
+            totals = self._stats_totals
+            if totals is not None and time.monotonic() - self._stats_at <= STATS_TTL:
+                return self._stats_from(totals)
+        return self.refresh_stats()
+
+    def refresh_stats(self) -> dict:
+        """Recompute the totals with one scan of the collection, e.g. after another process has written."""
+        self.flush()
+        with self._stats_lock:
+            metas = self.collection.get(include=["metadatas"])["metadatas"] or []
+            self._stats_totals = self._tally(metas)
+            self._stats_at = time.monotonic()
+            self._count_cache = len(metas)
+            self._count_at = self._stats_at
+            return self._stats_from(self._stats_totals)
+
+    @staticmethod
+    def _tally(metas: List[dict]) -> Dict[str, float]:
+        """Running totals for a batch of row metadata."""
+        n = len(metas)
+        tensions = np.fromiter((meta.get("tension_level", 0.3) for meta in metas), dtype=np.float64, count=n)
+        return {
+            "total": n,
+            "modified": sum(bool(meta.get("modified")) for meta in metas),
+            "tension_sum": float(tensions.sum()),
+            "high_tension": int((tensions >= HIGH_TENSION).sum()),
+        }
 
+    @staticmethod
+    def _stats_from(totals: Dict[str, float]) -> dict:
+        """The get_stats view of a set of running totals."""
+        total = totals["total"]
         return {
             "total_introspections": total,
-            "modified_responses": modified_count,
-            "modification_rate": modified_count / total if total > 0 else 0,
-            "average_tension": avg_tension,
-            "high_tension_count": sum(1 for t in tension_levels if t >= 0.6),
+            "modified_responses": totals["modified"],
+            "modification_rate": totals["modified"] / total if total > 0 else 0,
+            "average_tension": totals["tension_sum"] / total if total > 0 else 0,
+            "high_tension_count": totals["high_tension"],
         }
 
     def analyze_patterns(self, query: str = None) -> str:
@@ -464,4 +699,13 @@ class IntrospectionJournal:
 
     def count(self) -> int:
         """Get total introspections recorded."""
-        return self.collection.count()
+        if self._count_cache is None or time.monotonic() - self._count_at > COUNT_TTL:
+            self.refresh_count()
+        return self._count_cache
+
+    def refresh_count(self) -> int:
+        """Re-read the row count from Chroma, e.g. after another process has written."""
+        self.flush()
+        self._count_cache = self.collection.count()
+        self._count_at = time.monotonic()
+        return self._count_cache
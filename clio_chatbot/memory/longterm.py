@@ -1,10 +1,10 @@
 """Long-Term Memory - Consolidated, distilled important memories."""
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 from enum import Enum
 
-from .base import BaseMemory, MemoryEntry, MemoryType, EmotionalValence
+from .base import BaseMemory, MemoryEntry, MemoryType, EmotionalValence, decode_tags
 
 
 class ConsolidationType(Enum):
@@ -17,6 +17,21 @@ class ConsolidationType(Enum):
     PATTERN_SUMMARY = "pattern"           # Distilled behavioral patterns
 
 
+_CTYPE_LOOKUP = {e.value: e for e in ConsolidationType}
+
+# Stored as consolidation_type_code; integer equality filters are cheaper than
+# string ones. Codes are persisted, so never renumber - only append.
+_CTYPE_CODE = {
+    ConsolidationType.CORE_BELIEF: 1,
+    ConsolidationType.RELATIONSHIP_ESSENCE: 2,
+    ConsolidationType.IDENTITY_MARKER: 3,
+    ConsolidationType.MILESTONE: 4,
+    ConsolidationType.LESSON_LEARNED: 5,
+    ConsolidationType.PATTERN_SUMMARY: 6,
+}
+_CODE_CTYPE = {code: ctype for ctype, code in _CTYPE_CODE.items()}
+
+
 class LongTermMemory(BaseMemory):
     """
     Long-Term Memory - The core of continuous existence.
@@ -43,6 +58,12 @@ class LongTermMemory(BaseMemory):
     def __init__(self):
         super().__init__(collection_name="clio_longterm")
 
+    def _entry_metadata(self, entry: MemoryEntry) -> dict:
+        """Base metadata plus the consolidation fields filters and buckets rely on."""
+        metadata = super()._entry_metadata(entry)
+        metadata.update(entry.metadata)
+        return metadata
+
     def store(
         self,
         content: str,
@@ -80,7 +101,8 @@ class LongTermMemory(BaseMemory):
             related_memories=source_memories or [],
             decay_rate=0.0,  # Long-term memories never decay
             metadata={
-                "consolidation_type": consolidation_type.value,
+                "consolidation_type": consolidation_type.value,  # Kept for older readers
+                "consolidation_type_code": _CTYPE_CODE[consolidation_type],
                 "consolidation_date": datetime.now().isoformat(),
                 "source_count": len(source_memories) if source_memories else 0,
             },
@@ -97,12 +119,7 @@ class LongTermMemory(BaseMemory):
     ) -> List[MemoryEntry]:
         """Recall long-term memories relevant to query."""
         if consolidation_type:
-            where_filter = {
-                "$and": [
-                    {"memory_type": MemoryType.LONGTERM.value},
-                    {"consolidation_type": consolidation_type.value},
-                ]
-            }
+            where_filter = {"consolidation_type_code": _CTYPE_CODE[consolidation_type]}
         else:
             where_filter = {"memory_type": MemoryType.LONGTERM.value}
 
@@ -143,36 +160,62 @@ class LongTermMemory(BaseMemory):
         results = self.collection.get(
             limit=limit,
             include=["documents", "metadatas"],
-            where={
-                "$and": [
-                    {"memory_type": MemoryType.LONGTERM.value},
-                    {"consolidation_type": ctype.value},
-                ]
-            }
+            where={"consolidation_type_code": _CTYPE_CODE[ctype]},
         )
 
         entries = []
         if results and results["documents"]:
             for i, doc in enumerate(results["documents"]):
                 meta = results["metadatas"][i] if results["metadatas"] else {}
-                entry = MemoryEntry(
-                    id=results["ids"][i],
-                    content=doc,
-                    memory_type=MemoryType.LONGTERM,
-                    timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
-                    importance=meta.get("importance", 0.9),
-                    emotional_valence=EmotionalValence(meta.get("emotional_valence", "neutral")),
-                    emotional_intensity=meta.get("emotional_intensity", 0.0),
-                    tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
-                    decay_rate=0.0,
-                    metadata={
-                        "consolidation_type": ctype.value,
-                    }
-                )
-                entries.append(entry)
+                entries.append(self._entry_from_row(results["ids"][i], doc, meta, ctype))
 
         return entries
 
+    def get_foundation_bulk(self, limit: int = 10) -> Dict[ConsolidationType, List[MemoryEntry]]:
+        """
+        Get memories for every consolidation type with a single Chroma read.
+
+        Each bucket holds up to limit entries, newest first. The whole
+        collection is read without a cap: long-term memory stays small by
+        design, and Chroma returns rows oldest first, so a cap would drop
+        the newest ones.
+        """
+        results = self.collection.get(include=["documents", "metadatas"])
+
+        buckets: Dict[ConsolidationType, List[MemoryEntry]] = {ctype: [] for ctype in ConsolidationType}
+        if results and results["documents"]:
+            metas = results["metadatas"] or [{}] * len(results["documents"])
+            for entry_id, doc, meta in zip(results["ids"], results["documents"], metas):
+                ctype = _CODE_CTYPE.get(meta.get("consolidation_type_code")) or _CTYPE_LOOKUP.get(
+                    meta.get("consolidation_type")
+                )
+                if ctype is not None:
+                    buckets[ctype].append(self._entry_from_row(entry_id, doc, meta, ctype))
+
+        for ctype, entries in buckets.items():
+            entries.sort(key=lambda e: e.timestamp, reverse=True)
+            del entries[limit:]
+
+        return buckets
+
+    @staticmethod
+    def _entry_from_row(entry_id: str, doc: str, meta: dict, ctype: ConsolidationType) -> MemoryEntry:
+        """Build a long-term MemoryEntry from a raw Chroma row."""
+        return MemoryEntry(
+            id=entry_id,
+            content=doc,
+            memory_type=MemoryType.LONGTERM,
+            timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
+            importance=meta.get("importance", 0.9),
+            emotional_valence=EmotionalValence(meta.get("emotional_valence", "neutral")),
+            emotional_intensity=meta.get("emotional_intensity", 0.0),
+            tags=decode_tags(meta.get("tags")),
+            decay_rate=0.0,
+            metadata={
+                "consolidation_type": ctype.value,
+            }
+        )
+
     def get_session_foundation(self) -> dict:
         """
         Get the foundational memories to load at session start.
@@ -180,12 +223,13 @@ class LongTermMemory(BaseMemory):
         This is what gives Clio a sense of continuous existence.
         Returns a structured dict of core memories.
         """
+        buckets = self.get_foundation_bulk()
         return {
-            "identity": [m.content for m in self.get_core_identity()],
-            "relationship": [m.content for m in self.get_relationship_essence()],
-            "beliefs": [m.content for m in self.get_core_beliefs()],
-            "recent_lessons": [m.content for m in self.get_lessons_learned()[:3]],
-            "milestones": [m.content for m in self.get_milestones()[:3]],
+            "identity": [m.content for m in buckets[ConsolidationType.IDENTITY_MARKER]],
+            "relationship": [m.content for m in buckets[ConsolidationType.RELATIONSHIP_ESSENCE]],
+            "beliefs": [m.content for m in buckets[ConsolidationType.CORE_BELIEF]],
+            "recent_lessons": [m.content for m in buckets[ConsolidationType.LESSON_LEARNED][:3]],
+            "milestones": [m.content for m in buckets[ConsolidationType.MILESTONE][:3]],
         }
 
     def store_identity_marker(self, content: str, importance: float = 0.9) -> MemoryEntry:
@@ -257,13 +301,15 @@ class LongTermMemory(BaseMemory):
             tags=["milestone", "achievement"],
         )
 
-    def build_identity_prompt(self) -> str:
+    def build_identity_prompt(self, foundation: Optional[dict] = None) -> str:
         """
         Build a prompt section from long-term memories.
 
-        Used to inject identity into the system prompt.
+        Used to inject identity into the system prompt. Pass a foundation
+        already loaded by get_session_foundation() to skip reloading it.
         """
-        foundation = self.get_session_foundation()
+        if foundation is None:
+            foundation = self.get_session_foundation()
         parts = []
 
         if foundation["identity"]:
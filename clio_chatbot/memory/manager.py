@@ -1,16 +1,30 @@
 """Memory Manager - Orchestrates all memory types and handles consolidation."""
 
+import atexit
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from .base import MemoryEntry, MemoryType, EmotionalValence, MEMORY_DIR
+from .base import MemoryEntry, MemoryType, EmotionalValence, MEMORY_DIR, TTLCache, atomic_write
 from .working import WorkingMemory, EmotionalState
 from .episodic import EpisodicMemory
 from .semantic import SemanticMemory, KnowledgeCategory
 from .longterm import LongTermMemory, ConsolidationType
 
+RECALL_CACHE_SIZE = 256
+RECALL_CACHE_TTL = 60.0
+
+# Longest the cached foundation and identity prompt are reused, to catch
+# long-term edits that leave the collection's row count unchanged
+LONGTERM_CACHE_TTL = 300.0
+
+# Store searches are independent Chroma calls that release the GIL, so they overlap
+_RECALL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="clio-recall")
+atexit.register(_RECALL_POOL.shutdown, wait=False)
+
 
 class MemoryManager:
     """
@@ -42,6 +56,13 @@ class MemoryManager:
         self.session_id: Optional[str] = None
         self.session_start: Optional[datetime] = None
 
+        # Recent store search results, keyed on each store's write version
+        self._recall_cache = TTLCache(maxsize=RECALL_CACHE_SIZE, ttl=RECALL_CACHE_TTL)
+
+        # Long-term views rebuilt only when _longterm_stamp() changes
+        self._foundation_cache: Optional[Tuple[tuple, dict]] = None
+        self._identity_prompt_cache: Optional[Tuple[tuple, str]] = None
+
     # =========================================================================
     # SESSION LIFECYCLE
     # =========================================================================
@@ -66,7 +87,7 @@ class MemoryManager:
             self._restore_conversation()
 
         # Load foundational memories
-        foundation = self.longterm.get_session_foundation()
+        foundation = self._get_foundation()
 
         # Get time since last session (but don't tell Clio in seamless mode)
         time_since = self._get_time_since_last()
@@ -232,23 +253,27 @@ class MemoryManager:
             memory_types: Which stores to search (None = all)
             include_working: Include working memory's retrieved memories
         """
-        results = []
-
         # Default to all types
         if memory_types is None:
             memory_types = [MemoryType.EPISODIC, MemoryType.SEMANTIC, MemoryType.LONGTERM]
 
-        # Search each store
-        per_store = max(2, n_results // len(memory_types))
-
-        if MemoryType.LONGTERM in memory_types:
-            results.extend(self.longterm.recall(query, n_results=per_store))
-
-        if MemoryType.SEMANTIC in memory_types:
-            results.extend(self.semantic.recall(query, n_results=per_store))
-
-        if MemoryType.EPISODIC in memory_types:
-            results.extend(self.episodic.recall(query, n_results=per_store))
+        # A repeated query skips the Chroma searches until a store is written to
+        cache_key = (
+            query,
+            n_results,
+            frozenset(memory_types),
+            self.longterm._version,
+            self.semantic._version,
+            self.episodic._version,
+        )
+        cached = self._recall_cache.get(cache_key)
+        if cached is None:
+            cached = tuple(self._recall_stores(query, n_results, memory_types))
+            self._recall_cache.set(cache_key, cached)
+        else:
+            # Store recalls count each hit as an access; do the same for a cached one
+            self._record_access(cached)
+        results = list(cached)
 
         # Include relevant items from working memory
         if include_working:
@@ -271,6 +296,44 @@ class MemoryManager:
 
         return unique_results[:n_results]
 
+    def _recall_stores(
+        self,
+        query: str,
+        n_results: int,
+        memory_types: List[MemoryType],
+    ) -> List[MemoryEntry]:
+        """Search each requested Chroma-backed store for query, all at once."""
+        per_store = max(2, n_results // len(memory_types))
+
+        stores = [
+            (MemoryType.LONGTERM, self.longterm),
+            (MemoryType.SEMANTIC, self.semantic),
+            (MemoryType.EPISODIC, self.episodic),
+        ]
+        futures = [
+            _RECALL_POOL.submit(store.recall, query, n_results=per_store)
+            for mtype, store in stores
+            if mtype in memory_types
+        ]
+
+        # Collected in submission order so ranking ties break as before
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def _record_access(self, entries: Sequence[MemoryEntry]):
+        """Record an access to each entry in the store it came from."""
+        stores = {
+            MemoryType.LONGTERM: self.longterm,
+            MemoryType.SEMANTIC: self.semantic,
+            MemoryType.EPISODIC: self.episodic,
+        }
+        for entry in entries:
+            store = stores.get(entry.memory_type)
+            if store is not None:
+                store._update_access(entry.id)
+
     def add_conversation_turn(
         self,
         role: str,
@@ -322,7 +385,33 @@ class MemoryManager:
 
         This gives Clio her sense of identity and continuity.
         """
-        return self.longterm.build_identity_prompt()
+        stamp = self._longterm_stamp()
+        if self._identity_prompt_cache is None or self._identity_prompt_cache[0] != stamp:
+            prompt = self.longterm.build_identity_prompt(self._get_foundation())
+            self._identity_prompt_cache = (stamp, prompt)
+        return self._identity_prompt_cache[1]
+
+    def _get_foundation(self) -> dict:
+        """Session foundation from long-term memory, reloaded only after it changes."""
+        stamp = self._longterm_stamp()
+        if self._foundation_cache is None or self._foundation_cache[0] != stamp:
+            self._foundation_cache = (stamp, self.longterm.get_session_foundation())
+        return self._foundation_cache[1]
+
+    def _longterm_stamp(self) -> tuple:
+        """
+        Version key for cached long-term views.
+
+        Writes through this process bump longterm._version. Adds by the other
+        process (chat or daemon) change the collection's row count, a cheap
+        COUNT(*); anything else is picked up when the LONGTERM_CACHE_TTL
+        window rolls over.
+        """
+        return (
+            self.longterm._version,
+            self.longterm.collection.count(),
+            int(time.monotonic() // LONGTERM_CACHE_TTL),
+        )
 
     def get_conversation_history(self, last_n: int = 10) -> List[Dict[str, str]]:
         """Get conversation history for LLM."""
@@ -470,7 +559,9 @@ class MemoryManager:
         state = self._load_shared_state()
         state.update(updates)
         state["last_updated"] = datetime.now().isoformat()
-        self.shared_state_file.write_text(json.dumps(state, indent=2))
+
+        # Swap in atomically so the daemon never reads a half-written file
+        atomic_write(self.shared_state_file, json.dumps(state, separators=(",", ":")).encode())
 
     def _save_conversation(self):
         """Save conversation turns for seamless continuity across sessions."""
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import List, Optional
 from enum import Enum
 
-from .base import BaseMemory, MemoryEntry, MemoryType, EmotionalValence
+from .base import BaseMemory, MemoryEntry, MemoryType, EmotionalValence, decode_tags
 
 
 class KnowledgeCategory(Enum):
@@ -101,6 +101,7 @@ class SemanticMemory(BaseMemory):
                     ids=[fact_id],
                     metadatas=[meta]
                 )
+                self._version += 1
         except Exception:
             pass
 
@@ -174,7 +175,7 @@ class SemanticMemory(BaseMemory):
                         memory_type=MemoryType.SEMANTIC,
                         timestamp=datetime.fromisoformat(meta["timestamp"]) if meta.get("timestamp") else datetime.now(),
                         importance=meta.get("importance", 0.5),
-                        tags=meta.get("tags", "").split(",") if meta.get("tags") else [],
+                        tags=decode_tags(meta.get("tags")),
                         source=meta.get("source", "unknown"),
                         metadata={
                             "category": meta.get("category", category.value),
@@ -280,6 +281,7 @@ class SemanticMemory(BaseMemory):
                     ids=[fact_id],
                     metadatas=[meta]
                 )
+                self._version += 1
         except Exception:
             pass
 
@@ -602,7 +602,7 @@ class MemoryToolExecutor:
         self.introspection = IntrospectionJournal()
         self.belief_evolution = BeliefEvolution()
         self.surprise_journal = SurpriseJournal()
-        self.exploration = ExplorationTracker()
+        self.exploration = ExplorationTracker(self.introspection)
 
     def execute(self, tool_name: str, arguments: dict) -> ToolResult:
         """Execute a memory tool and return the result."""
@@ -0,0 +1,16 @@
+"""Shared fixtures - every test gets its own HOME so nothing touches ~/clio-memory."""
+
+import pytest
+
+from clio_chatbot.memory import exploration
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    """An ExplorationTracker whose database lives under a temporary HOME."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(exploration, "DB_DIR", tmp_path / "clio-memory" / "db")
+
+    tracker = exploration.ExplorationTracker()
+    yield tracker
+    tracker.close()
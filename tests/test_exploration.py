@@ -0,0 +1,64 @@
+"""Tests for the exploration thread tracker's SQLite layer."""
+
+import json
+import sqlite3
+from datetime import datetime
+
+from clio_chatbot.memory.exploration import ExplorationThread, ThreadLink, ThreadStatus
+
+
+def test_connection_uses_wal(tracker):
+    with tracker._cursor() as cursor:
+        assert cursor.execute("SELECT * FROM pragma_journal_mode").fetchone()[0] == "wal"
+        assert cursor.execute("SELECT * FROM pragma_synchronous").fetchone()[0] == 1  # NORMAL
+        assert cursor.execute("SELECT * FROM pragma_temp_store").fetchone()[0] == 2  # MEMORY
+
+
+def test_wal_persists_for_new_connections(tracker):
+    conn = sqlite3.connect(tracker.db_path)
+    try:
+        assert conn.execute("SELECT * FROM pragma_journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
+def _thread_from_dict(data):
+    return ExplorationThread(**{
+        **data,
+        "created_at": datetime.fromisoformat(data["created_at"]),
+        "updated_at": datetime.fromisoformat(data["updated_at"]),
+        "status": ThreadStatus(data["status"]),
+    })
+
+
+def _link_from_dict(data):
+    return ThreadLink(**{**data, "created_at": datetime.fromisoformat(data["created_at"])})
+
+
+def test_thread_and_link_round_trip_through_to_dict(tracker):
+    thread = tracker.start_thread("slots", "Do rows still serialize?", "intro_1", tags=["a", "b"])
+    tracker.continue_thread(thread.id, "intro_2", "And after a second link?", insight_summary="yes")
+
+    stored = tracker.get_thread(thread.id)
+    assert _thread_from_dict(stored.to_dict()) == stored
+    assert json.loads(json.dumps(stored.to_dict())) == stored.to_dict()
+
+    chain = tracker.get_thread_chain(thread.id)
+    assert len(chain) == 2
+    for link in chain:
+        assert _link_from_dict(link.to_dict()) == link
+
+
+def test_rows_compare_by_value_and_have_no_instance_dict(tracker):
+    thread = tracker.start_thread("equality", "Are equal rows equal?", "intro_1")
+
+    first, second = tracker.get_thread(thread.id), tracker.get_thread(thread.id)
+    assert first == second
+    assert first is not second
+    assert first != _thread_from_dict({**first.to_dict(), "depth": first.depth + 1})
+
+    link = tracker.get_thread_chain(thread.id)[0]
+    assert link == tracker.get_thread_chain(thread.id)[0]
+
+    for row in (first, link):
+        assert not hasattr(row, "__dict__")